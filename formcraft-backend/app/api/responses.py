@@ -0,0 +1,99 @@
+"""Fast JSON responses for large payloads that are already trusted."""
+
+import gzip
+import json
+from typing import Any
+
+from fastapi import Request, status
+from fastapi.responses import Response
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import brotli
+except ImportError:
+    brotli = None
+
+# Bodies smaller than this are sent uncompressed
+MIN_COMPRESS_SIZE = 1024
+GZIP_LEVEL = 5
+BROTLI_QUALITY = 4
+
+
+def dumps(data: Any) -> bytes:
+    """
+    Serialize JSON-native data to bytes.
+
+    Uses orjson when installed, otherwise the stdlib encoder.
+
+    Args:
+        data: Dicts, lists, strings and numbers only
+
+    Returns:
+        UTF-8 encoded JSON
+    """
+    if orjson is not None:
+        return orjson.dumps(data)
+    return json.dumps(data, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+
+
+def _accepted_encodings(header: str) -> set[str]:
+    """Parse an Accept-Encoding header, dropping codings with q=0."""
+    encodings = set()
+    for part in header.split(","):
+        name, _, params = part.partition(";")
+        params = params.strip()
+        if params.startswith("q="):
+            try:
+                if float(params[2:]) <= 0:
+                    continue
+            except ValueError:
+                continue
+        name = name.strip().lower()
+        if name:
+            encodings.add(name)
+    return encodings
+
+
+def fast_json_response(
+    data: Any,
+    request: Request | None = None,
+    status_code: int = status.HTTP_200_OK,
+) -> Response:
+    """
+    Build a JSON response without Pydantic validation or re-encoding.
+
+    Only pass data that was produced internally or read back from the
+    database; the route's response_model is not applied. The body is
+    compressed with br or gzip when the client accepts it and it is large
+    enough to benefit.
+
+    Args:
+        data: JSON-native payload matching the route's response_model
+        request: Incoming request, used for content negotiation
+        status_code: HTTP status code
+
+    Returns:
+        Response with a pre-encoded body
+    """
+    body = dumps(data)
+    headers = {"Vary": "Accept-Encoding"}
+
+    if request is not None and len(body) >= MIN_COMPRESS_SIZE:
+        accepted = _accepted_encodings(request.headers.get("accept-encoding", ""))
+        if brotli is not None and "br" in accepted:
+            body = brotli.compress(body, quality=BROTLI_QUALITY)
+            headers["Content-Encoding"] = "br"
+        elif "gzip" in accepted:
+            body = gzip.compress(body, compresslevel=GZIP_LEVEL)
+            headers["Content-Encoding"] = "gzip"
+
+    return Response(
+        content=body,
+        status_code=status_code,
+        headers=headers,
+        media_type="application/json",
+    )
@@ -1,19 +1,33 @@
 """Form import and OCR detection endpoints."""
 
+import asyncio
 import logging
 from uuid import UUID
 
-from fastapi import APIRouter, Depends, File, HTTPException, UploadFile, status
+from fastapi import (
+    APIRouter,
+    Depends,
+    File,
+    HTTPException,
+    Query,
+    Request,
+    UploadFile,
+    status,
+)
+from pydantic import ValidationError
 
 from app.api.deps import get_current_user
+from app.api.responses import fast_json_response
 from app.core.supabase import get_supabase_client
 from app.models.form_detection import (
     AcceptDetectionRequest,
-    DetectedField,
+    DetectedFieldList,
     FormDetectionResponse,
 )
 from app.models.user import UserProfile
-from app.services.ocr import AzureOCRClient, BoundingBoxConverter, FieldClassifier
+from app.services.detection_retention import DetectionRetentionJob, retention_metrics
+from app.services import ocr
+from app.services.ocr import BoundingBoxConverter, FieldClassifier
 
 router = APIRouter(prefix="/forms", tags=["forms"])
 logger = logging.getLogger(__name__)
@@ -22,6 +36,7 @@ logger = logging.getLogger(__name__)
 @router.post("/import/{template_id}", response_model=FormDetectionResponse)
 async def import_form(
     template_id: UUID,
+    request: Request,
     file: UploadFile = File(...),
     page_index: int = 0,
     current_user: UserProfile = Depends(get_current_user),
@@ -31,6 +46,7 @@ async def import_form(
 
     Args:
         template_id: Template to attach this form to
+        request: Incoming request (for response compression)
         file: Image file (JPEG, PNG)
         page_index: Page index to import to (default 0)
         current_user: Authenticated user
@@ -58,8 +74,8 @@ async def import_form(
         )
 
     try:
-        # Initialize OCR client
-        ocr_client = AzureOCRClient()
+        # Initialize OCR client (loads the Azure SDK on first use)
+        ocr_client = ocr.AzureOCRClient()
 
         # Perform OCR
         ocr_result = ocr_client.analyze_layout(image_bytes)
@@ -82,47 +98,43 @@ async def import_form(
         # Initialize field classifier
         classifier = FieldClassifier()
 
-        # Process detected words into fields
-        detected_fields: list[DetectedField] = []
-        words = ocr_result.get("words", [])
-
-        for word in words:
-            # Convert bbox to mm
-            bbox_mm = converter.convert_bbox(word["bbox"])
+        # Process detected words into fields, built as plain dicts and
+        # validated once as a list before they are stored
+        detected_fields: list[dict] = []
+        words = ocr_result["words"]
 
-            # Get nearby labels for context
-            nearby_labels = classifier.get_nearby_labels(
-                word["bbox"], words, max_distance=100
-            )
+        # Convert all bboxes to mm in one pass
+        bboxes_mm = converter.convert_page_words(words)
 
-            # Classify field type
-            suggested_type = classifier.classify_field(
-                text=word["text"], bbox=bbox_mm, nearby_labels=nearby_labels
+        for index, bbox_mm in enumerate(bboxes_mm):
+            # Classify field type using nearby labels for context
+            suggested_type = classifier.classify_word(
+                words, index, bbox=bbox_mm, max_distance=100
             )
 
             detected_fields.append(
-                DetectedField(
-                    text=word["text"],
-                    bbox=bbox_mm,
-                    confidence=word["confidence"],
-                    suggested_type=suggested_type,
-                    status="pending",
-                )
+                {
+                    "text": words.texts[index],
+                    "bbox": bbox_mm,
+                    "confidence": words.confidence[index],
+                    "suggested_type": suggested_type,
+                    "status": "pending",
+                }
             )
 
+        # Single write-time check; stored rows are trusted on read
+        DetectedFieldList.validate_python(detected_fields)
+
         # Get page dimensions in mm
         page_width_mm, page_height_mm = converter.get_page_dimensions_mm()
 
         # Store detection in database
         client = get_supabase_client()
 
-        # Convert detected fields to dict for JSONB storage
-        fields_json = [field.model_dump() for field in detected_fields]
-
         insert_data = {
             "template_id": str(template_id),
             "page_index": page_index,
-            "detected_fields": fields_json,
+            "detected_fields": detected_fields,
             "page_dimensions": {"width": page_width_mm, "height": page_height_mm},
         }
 
@@ -140,15 +152,24 @@ async def import_form(
             f"OCR complete: detected {len(detected_fields)} fields for template {template_id}"
         )
 
-        return FormDetectionResponse(
-            id=detection_record["id"],
-            template_id=template_id,
-            page_index=page_index,
-            detected_fields=detected_fields,
-            page_dimensions={"width": page_width_mm, "height": page_height_mm},
-            created_at=detection_record["created_at"],
+        return fast_json_response(
+            {
+                "id": detection_record["id"],
+                "template_id": str(template_id),
+                "page_index": page_index,
+                "detected_fields": detected_fields,
+                "page_dimensions": {"width": page_width_mm, "height": page_height_mm},
+                "created_at": detection_record["created_at"],
+            },
+            request,
         )
 
+    except ValidationError as e:
+        logger.error(f"Detected fields failed validation: {e}", exc_info=True)
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail="Detected fields failed validation",
+        )
     except ValueError as e:
         logger.error(f"Configuration error: {e}")
         raise HTTPException(
@@ -166,6 +187,7 @@ async def import_form(
 @router.get("/{template_id}/detections", response_model=list[FormDetectionResponse])
 async def get_detections(
     template_id: UUID,
+    request: Request,
     current_user: UserProfile = Depends(get_current_user),
 ):
     """
@@ -173,6 +195,7 @@ async def get_detections(
 
     Args:
         template_id: Template ID
+        request: Incoming request (for response compression)
         current_user: Authenticated user
 
     Returns:
@@ -182,34 +205,16 @@ async def get_detections(
 
     response = (
         client.table("form_detections")
-        .select("*")
+        .select("id, template_id, page_index, detected_fields, page_dimensions, created_at")
         .eq("template_id", str(template_id))
         .order("created_at", desc=True)
         .execute()
     )
 
-    if not response.data:
-        return []
-
-    results = []
-    for record in response.data:
-        # Parse detected_fields from JSONB
-        detected_fields = [
-            DetectedField(**field) for field in record["detected_fields"]
-        ]
-
-        results.append(
-            FormDetectionResponse(
-                id=record["id"],
-                template_id=UUID(record["template_id"]),
-                page_index=record["page_index"],
-                detected_fields=detected_fields,
-                page_dimensions=record["page_dimensions"],
-                created_at=record["created_at"],
-            )
-        )
-
-    return results
+    # detected_fields were validated against DetectedField by import_form
+    # before insert, so rows are passed through without rebuilding models.
+    # created_at is returned as stored (Postgres ISO 8601, "+00:00" offset).
+    return fast_json_response(response.data or [], request)
 
 
 @router.post("/{template_id}/detections/{detection_id}/accept")
@@ -303,3 +308,55 @@ async def delete_detection(
 
     logger.info(f"Deleted detection {detection_id}")
     return {"message": "Detection deleted successfully"}
+
+
+@router.delete("/{template_id}/detections")
+async def delete_template_detections(
+    template_id: UUID,
+    keep_last: int = Query(0, ge=0, description="Number of newest detections to keep"),
+    current_user: UserProfile = Depends(get_current_user),
+):
+    """
+    Bulk delete detections for a template.
+
+    Args:
+        template_id: Template ID
+        keep_last: Number of most recent detections to keep (default 0 deletes all)
+        current_user: Authenticated user
+
+    Returns:
+        Message with rows and bytes reclaimed; ``complete`` is False when the
+        batch cap was reached and the request should be repeated
+    """
+    client = get_supabase_client()
+
+    job = DetectionRetentionJob(client, keep_last=keep_last)
+    # Batches are blocking RPC round trips; keep them off the event loop
+    stats = await asyncio.to_thread(job.purge, template_id)
+
+    message = f"Deleted {stats['deleted_rows']} detections"
+    if not stats["complete"]:
+        message += "; more remain, repeat the request"
+
+    return {
+        "message": message,
+        "deleted_rows": stats["deleted_rows"],
+        "reclaimed_bytes": stats["reclaimed_bytes"],
+        "complete": stats["complete"],
+    }
+
+
+@router.get("/detections/retention")
+async def get_retention_metrics(
+    current_user: UserProfile = Depends(get_current_user),
+):
+    """
+    Get detection retention metrics for this worker process.
+
+    Args:
+        current_user: Authenticated user
+
+    Returns:
+        Run count, cumulative rows and bytes reclaimed, and the last run
+    """
+    return retention_metrics.snapshot()
@@ -1,10 +1,16 @@
 """Form detection models for OCR field detection."""
 
 from datetime import datetime
-from typing import Literal
+from typing import Annotated, Literal
 from uuid import UUID
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, TypeAdapter
+from typing_extensions import NotRequired, TypedDict
+
+SuggestedType = Literal[
+    "date", "currency", "text", "number", "signature", "checkbox", "unknown"
+]
+DetectionStatus = Literal["pending", "accepted", "rejected"]
 
 
 class DetectedField(BaseModel):
@@ -13,12 +19,24 @@ class DetectedField(BaseModel):
     text: str = Field(description="Detected text content")
     bbox: dict[str, float] = Field(description="Bounding box in mm: {x, y, width, height}")
     confidence: float = Field(ge=0.0, le=1.0, description="OCR confidence score")
-    suggested_type: Literal[
-        "date", "currency", "text", "number", "signature", "checkbox", "unknown"
-    ] = Field(description="Suggested FormCraft element type")
-    status: Literal["pending", "accepted", "rejected"] = Field(
-        default="pending", description="Review status"
-    )
+    suggested_type: SuggestedType = Field(description="Suggested FormCraft element type")
+    status: DetectionStatus = Field(default="pending", description="Review status")
+
+
+class DetectedFieldDict(TypedDict):
+    """Plain-dict mirror of DetectedField, with the same constraints."""
+
+    text: str
+    bbox: dict[str, float]
+    confidence: Annotated[float, Field(ge=0.0, le=1.0)]
+    suggested_type: SuggestedType
+    status: NotRequired[DetectionStatus]
+
+
+# Validates a whole detected_fields list in one pass. Validating against the
+# TypedDict mirror checks the same constraints as DetectedField but yields
+# plain dicts, so no model instance is built per field.
+DetectedFieldList = TypeAdapter(list[DetectedFieldDict])
 
 
 class FormDetectionCreate(BaseModel):
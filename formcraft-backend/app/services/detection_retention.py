@@ -0,0 +1,242 @@
+"""Retention and bulk cleanup of stale form detections."""
+
+import asyncio
+import logging
+import random
+import threading
+import time
+from contextlib import asynccontextmanager, suppress
+from typing import Any, AsyncIterator, TypedDict
+from uuid import UUID
+
+from app.core.config import settings
+from app.core.supabase import get_supabase_client
+
+logger = logging.getLogger(__name__)
+
+# Fallbacks for the FORM_DETECTION_* fields on app.core.config.Settings.
+# None disables that policy; retention is off until one is configured.
+DEFAULT_RETENTION_DAYS: int | None = None
+DEFAULT_KEEP_LAST: int | None = None
+DEFAULT_BATCH_SIZE = 500
+DEFAULT_INTERVAL_MINUTES = 60
+
+# Fraction of the interval added at random to each wait, so workers that
+# boot together do not purge together
+SCHEDULE_JITTER = 0.1
+
+
+class RetentionStats(TypedDict):
+    """Outcome of a purge run."""
+
+    deleted_rows: int
+    reclaimed_bytes: int
+    batches: int
+    complete: bool
+
+
+class RetentionMetrics:
+    """
+    Cumulative purge metrics for this process.
+
+    Updated by every DetectionRetentionJob run, scheduled or on demand, and
+    served by the retention metrics endpoint.
+    """
+
+    def __init__(self):
+        """Initialize empty metrics."""
+        self._lock = threading.Lock()
+        self.runs = 0
+        self.deleted_rows = 0
+        self.reclaimed_bytes = 0
+        self.last_run_at: float | None = None
+        self.last_run: RetentionStats | None = None
+
+    def record(self, stats: RetentionStats) -> None:
+        """Add one run's results to the totals."""
+        with self._lock:
+            self.runs += 1
+            self.deleted_rows += stats["deleted_rows"]
+            self.reclaimed_bytes += stats["reclaimed_bytes"]
+            self.last_run_at = time.time()
+            self.last_run = stats
+
+    def snapshot(self) -> dict[str, Any]:
+        """Get a copy of the current metrics."""
+        with self._lock:
+            return {
+                "runs": self.runs,
+                "deleted_rows": self.deleted_rows,
+                "reclaimed_bytes": self.reclaimed_bytes,
+                "last_run_at": self.last_run_at,
+                "last_run": dict(self.last_run) if self.last_run else None,
+            }
+
+
+retention_metrics = RetentionMetrics()
+
+
+class DetectionRetentionJob:
+    """
+    Deletes stale rows from form_detections in bounded batches.
+
+    A detection is stale when it is older than ``max_age_days`` or is not
+    among the ``keep_last`` most recent detections of its template. Each batch
+    is one call to the ``purge_form_detections`` database function.
+    """
+
+    DEFAULT_MAX_BATCHES = 100
+
+    def __init__(
+        self,
+        client: Any,
+        max_age_days: int | None = None,
+        keep_last: int | None = None,
+        batch_size: int = DEFAULT_BATCH_SIZE,
+        max_batches: int = DEFAULT_MAX_BATCHES,
+    ):
+        """
+        Initialize retention job.
+
+        Args:
+            client: Supabase client
+            max_age_days: Delete detections older than this many days (None to disable)
+            keep_last: Keep only this many newest detections per template (None to disable)
+            batch_size: Maximum rows deleted per database call
+            max_batches: Maximum batches per run, to bound a single run's duration
+        """
+        if batch_size <= 0:
+            raise ValueError("batch_size must be positive")
+        if keep_last is not None and keep_last < 0:
+            raise ValueError("keep_last must not be negative")
+
+        self.client = client
+        self.max_age_days = max_age_days
+        self.keep_last = keep_last
+        self.batch_size = batch_size
+        self.max_batches = max_batches
+
+    @classmethod
+    def from_settings(cls, client: Any) -> "DetectionRetentionJob":
+        """Create a job configured from application settings, falling back to defaults."""
+        return cls(
+            client,
+            max_age_days=getattr(
+                settings, "FORM_DETECTION_RETENTION_DAYS", DEFAULT_RETENTION_DAYS
+            ),
+            keep_last=getattr(settings, "FORM_DETECTION_KEEP_LAST", DEFAULT_KEEP_LAST),
+            batch_size=getattr(
+                settings, "FORM_DETECTION_RETENTION_BATCH_SIZE", DEFAULT_BATCH_SIZE
+            ),
+        )
+
+    @property
+    def enabled(self) -> bool:
+        """Whether any retention policy is configured."""
+        return self.max_age_days is not None or self.keep_last is not None
+
+    def purge(self, template_id: UUID | None = None) -> RetentionStats:
+        """
+        Delete stale detections batch by batch.
+
+        Blocking; call through ``asyncio.to_thread`` from async code.
+
+        Args:
+            template_id: Restrict the purge to a single template
+
+        Returns:
+            RetentionStats with rows and bytes reclaimed. ``complete`` is False
+            when the batch cap was reached and stale rows may remain.
+        """
+        stats = RetentionStats(deleted_rows=0, reclaimed_bytes=0, batches=0, complete=True)
+
+        if not self.enabled:
+            logger.info("Detection retention disabled; nothing to purge")
+            return stats
+
+        params = {
+            "p_max_age": (
+                f"{self.max_age_days} days" if self.max_age_days is not None else None
+            ),
+            "p_keep_last": self.keep_last,
+            "p_template_id": str(template_id) if template_id else None,
+            "p_batch_size": self.batch_size,
+        }
+
+        while True:
+            response = self.client.rpc("purge_form_detections", params).execute()
+            row = (response.data or [{}])[0]
+            deleted = row.get("deleted_rows") or 0
+
+            stats["batches"] += 1
+            stats["deleted_rows"] += deleted
+            stats["reclaimed_bytes"] += row.get("reclaimed_bytes") or 0
+
+            if deleted < self.batch_size:
+                break
+            if stats["batches"] >= self.max_batches:
+                stats["complete"] = False
+                logger.warning(
+                    f"Detection purge stopped after {self.max_batches} batches; "
+                    "remaining rows will be picked up by the next run"
+                )
+                break
+
+        retention_metrics.record(stats)
+
+        logger.info(
+            f"Purged {stats['deleted_rows']} detections "
+            f"({stats['reclaimed_bytes']} bytes) in {stats['batches']} batches"
+            + (f" for template {template_id}" if template_id else "")
+        )
+        return stats
+
+    async def run_forever(self, interval_seconds: float) -> None:
+        """
+        Run the purge periodically until cancelled.
+
+        The first run happens one (jittered) interval after start, so booting
+        a worker never triggers a purge.
+
+        Args:
+            interval_seconds: Delay between runs
+        """
+        while True:
+            await asyncio.sleep(
+                interval_seconds * (1 + random.uniform(0, SCHEDULE_JITTER))
+            )
+            try:
+                await asyncio.to_thread(self.purge)
+            except Exception as e:
+                logger.error(f"Detection retention run failed: {e}", exc_info=True)
+
+
+@asynccontextmanager
+async def detection_retention_lifespan() -> AsyncIterator[DetectionRetentionJob]:
+    """
+    Run the scheduled retention job for the lifetime of the app.
+
+    Enter from the FastAPI lifespan in app/main.py. Nothing is scheduled when
+    no retention policy is configured. Each worker process runs its own
+    jittered schedule; concurrent purges are safe because deletes are
+    idempotent.
+
+    Yields:
+        The job (scheduled only if enabled)
+    """
+    interval_minutes = getattr(
+        settings, "FORM_DETECTION_RETENTION_INTERVAL_MINUTES", DEFAULT_INTERVAL_MINUTES
+    )
+    job = DetectionRetentionJob.from_settings(get_supabase_client())
+    if not job.enabled:
+        logger.info("Detection retention disabled; no purge scheduled")
+        yield job
+        return
+
+    task = asyncio.create_task(job.run_forever(interval_minutes * 60))
+    try:
+        yield job
+    finally:
+        task.cancel()
+        with suppress(asyncio.CancelledError):
+            await task
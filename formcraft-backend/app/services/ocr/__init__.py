@@ -1,7 +1,64 @@
-"""OCR services for automatic field detection from form images."""
+"""OCR services for automatic field detection from form images.
+
+Heavy backends (the Azure SDK, Pillow) are imported on first use so that
+importing this package stays cheap for workers that never run OCR.
+"""
+
+import importlib
+from typing import TYPE_CHECKING, Any
 
-from .azure_ocr import AzureOCRClient
 from .field_classifier import FieldClassifier
 from .bounding_box_converter import BoundingBoxConverter
+from .page_words import PageWords, normalize_arabic
+
+if TYPE_CHECKING:
+    from .azure_ocr import AzureOCRClient
+
+# Public name -> submodule that defines it, loaded on first attribute access
+_LAZY_ATTRS = {"AzureOCRClient": ".azure_ocr"}
+
+# Extra modules preloaded by warm_up(), beyond the lazy attributes
+_WARM_UP_MODULES = ("PIL.Image",)
+
+# Set once warm_up() has completed
+_warm = False
+
+__all__ = [
+    "AzureOCRClient",
+    "FieldClassifier",
+    "BoundingBoxConverter",
+    "PageWords",
+    "normalize_arabic",
+    "is_warm",
+    "warm_up",
+]
+
+
+def __getattr__(name: str) -> Any:
+    module_name = _LAZY_ATTRS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    value = getattr(importlib.import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def warm_up() -> None:
+    """
+    Preload the heavy OCR backends.
+
+    Call after the health check passes so the first import request does not
+    pay the import cost. Blocking; run it in a thread from async code.
+    """
+    global _warm
+    for name in _LAZY_ATTRS:
+        __getattr__(name)
+    for module_name in _WARM_UP_MODULES:
+        importlib.import_module(module_name)
+    _warm = True
+
 
-__all__ = ["AzureOCRClient", "FieldClassifier", "BoundingBoxConverter"]
+def is_warm() -> bool:
+    """Whether warm_up() has completed, for readiness checks."""
+    return _warm
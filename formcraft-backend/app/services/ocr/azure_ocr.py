@@ -8,6 +8,8 @@ from azure.core.credentials import AzureKeyCredential
 
 from app.core.config import settings
 
+from .page_words import PageWords
+
 logger = logging.getLogger(__name__)
 
 
@@ -35,7 +37,7 @@ class AzureOCRClient:
 
         Returns:
             Dictionary containing:
-            - words: List of detected words with bbox, text, confidence
+            - words: PageWords with detected words, bboxes and confidences
             - lines: List of detected lines with bbox, text
             - page_dimensions: {width, height} in pixels
         """
@@ -48,7 +50,7 @@ class AzureOCRClient:
 
         if not result.pages:
             logger.warning("No pages detected in document")
-            return {"words": [], "lines": [], "page_dimensions": None}
+            return {"words": PageWords(), "lines": [], "page_dimensions": None}
 
         # Extract first page (support multi-page later)
         page = result.pages[0]
@@ -60,7 +62,7 @@ class AzureOCRClient:
         )
 
         # Extract words with bounding boxes
-        words = []
+        words = PageWords()
         for word in page.words or []:
             if word.polygon and len(word.polygon) >= 4:
                 # Azure returns polygon points; extract bounding box (x, y, width, height)
@@ -72,11 +74,7 @@ class AzureOCRClient:
                 height = max(y_coords) - y
 
                 words.append(
-                    {
-                        "text": word.content,
-                        "bbox": {"x": x, "y": y, "width": width, "height": height},
-                        "confidence": word.confidence or 0.0,
-                    }
+                    word.content, x, y, width, height, word.confidence or 0.0
                 )
 
         # Extract lines (groups of words)
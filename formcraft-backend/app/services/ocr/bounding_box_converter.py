@@ -3,6 +3,8 @@
 import logging
 from typing import TypedDict
 
+from .page_words import PageWords
+
 logger = logging.getLogger(__name__)
 
 
@@ -69,6 +71,29 @@ class BoundingBoxConverter:
             height=round(self.px_to_mm(bbox_px["height"]), 2),
         )
 
+    def convert_page_words(self, words: PageWords) -> list[BBox]:
+        """
+        Convert the bounding boxes of every word on a page from pixels to mm.
+
+        Args:
+            words: Detected words with pixel bounding boxes
+
+        Returns:
+            List of {x, y, width, height} in mm, in word order
+        """
+        px_to_mm = self.px_to_mm
+        return [
+            BBox(
+                x=round(px_to_mm(x), 2),
+                y=round(px_to_mm(y), 2),
+                width=round(px_to_mm(width), 2),
+                height=round(px_to_mm(height), 2),
+            )
+            for x, y, width, height in zip(
+                words.x, words.y, words.width, words.height
+            )
+        ]
+
     def get_page_dimensions_mm(self) -> tuple[float, float]:
         """Get page dimensions in mm."""
         return (round(self.page_width_mm, 2), round(self.page_height_mm, 2))
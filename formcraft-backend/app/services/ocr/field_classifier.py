@@ -6,6 +6,8 @@ from typing import Literal
 
 from app.models.enums import ElementType
 
+from .page_words import PageWords, normalize_arabic
+
 logger = logging.getLogger(__name__)
 
 # Arabic date indicators
@@ -30,12 +32,22 @@ CURRENCY_PATTERNS = [
     r"\d+\.\d{2,3}",  # 12345.67
 ]
 
+# Indicators normalized once, matched against normalized nearby label text
+_DATE_INDICATORS = [normalize_arabic(ind) for ind in DATE_INDICATORS_AR]
+_CURRENCY_INDICATORS = [normalize_arabic(ind) for ind in CURRENCY_INDICATORS_AR]
+_SIGNATURE_INDICATORS = [normalize_arabic(ind) for ind in SIGNATURE_INDICATORS_AR]
+
 
 class FieldClassifier:
     """Classifies detected OCR regions into FormCraft element types."""
 
     def classify_field(
-        self, text: str, bbox: dict, nearby_labels: list[str] | None = None
+        self,
+        text: str,
+        bbox: dict,
+        nearby_labels: list[str] | None = None,
+        *,
+        nearby_text: str | None = None,
     ) -> Literal[
         "date", "currency", "text", "number", "signature", "checkbox", "unknown"
     ]:
@@ -46,12 +58,15 @@ class FieldClassifier:
             text: Detected text content
             bbox: Bounding box {x, y, width, height}
             nearby_labels: Optional list of nearby label texts for context
+            nearby_text: Pre-normalized nearby label text; overrides nearby_labels
 
         Returns:
             Suggested element type
         """
-        text_lower = text.lower().strip()
-        nearby_text = " ".join(nearby_labels or []).lower()
+        if nearby_text is None:
+            nearby_text = " ".join(
+                normalize_arabic(label) for label in nearby_labels or []
+            )
 
         # Check for date patterns
         if self._is_date_field(text, nearby_text):
@@ -85,8 +100,8 @@ class FieldClassifier:
     def _is_date_field(self, text: str, nearby_text: str) -> bool:
         """Check if field is a date."""
         # Check nearby labels for date indicators
-        for indicator in DATE_INDICATORS_AR:
-            if indicator.lower() in nearby_text:
+        for indicator in _DATE_INDICATORS:
+            if indicator in nearby_text:
                 return True
 
         # Check text content for date patterns
@@ -99,8 +114,8 @@ class FieldClassifier:
     def _is_currency_field(self, text: str, nearby_text: str) -> bool:
         """Check if field is a currency/amount."""
         # Check nearby labels for currency indicators
-        for indicator in CURRENCY_INDICATORS_AR:
-            if indicator.lower() in nearby_text:
+        for indicator in _CURRENCY_INDICATORS:
+            if indicator in nearby_text:
                 return True
 
         # Check for currency symbols in text
@@ -111,9 +126,7 @@ class FieldClassifier:
         for pattern in CURRENCY_PATTERNS:
             if re.search(pattern, text):
                 # If nearby text mentions amount/currency, classify as currency
-                if any(
-                    ind.lower() in nearby_text for ind in CURRENCY_INDICATORS_AR
-                ):
+                if any(ind in nearby_text for ind in _CURRENCY_INDICATORS):
                     return True
 
         return False
@@ -121,14 +134,14 @@ class FieldClassifier:
     def _is_signature_field(self, text: str, nearby_text: str, bbox: dict) -> bool:
         """Check if field is a signature area."""
         # Check nearby labels for signature indicators
-        for indicator in SIGNATURE_INDICATORS_AR:
-            if indicator.lower() in nearby_text:
+        for indicator in _SIGNATURE_INDICATORS:
+            if indicator in nearby_text:
                 return True
 
         # Signature fields are usually empty or have minimal text
         if len(text.strip()) < 3 and bbox.get("width", 0) > 30:
             # Check if there's a signature label nearby
-            if any(ind.lower() in nearby_text for ind in SIGNATURE_INDICATORS_AR):
+            if any(ind in nearby_text for ind in _SIGNATURE_INDICATORS):
                 return True
 
         return False
@@ -161,33 +174,57 @@ class FieldClassifier:
         cleaned = text.replace(",", "").replace(".", "").replace(" ", "")
         return cleaned.isdigit() and len(cleaned) > 0
 
+    def classify_word(
+        self, words: PageWords, index: int, bbox: dict, max_distance: float = 50
+    ) -> Literal[
+        "date", "currency", "text", "number", "signature", "checkbox", "unknown"
+    ]:
+        """
+        Classify a word on a page using its precomputed normalized neighbours.
+
+        Args:
+            words: All detected words on the page
+            index: Index of the word to classify
+            bbox: Bounding box of the word in mm {x, y, width, height}
+            max_distance: Maximum distance in pixels to consider as "nearby"
+
+        Returns:
+            Suggested element type
+        """
+        nearby_text = " ".join(
+            words.normalized[i] for i in words.nearby(index, max_distance)
+        )
+        return self.classify_field(
+            text=words.texts[index], bbox=bbox, nearby_text=nearby_text
+        )
+
     def get_nearby_labels(
-        self, target_bbox: dict, all_words: list[dict], max_distance: float = 50
+        self,
+        target_bbox: dict,
+        all_words: PageWords | list[dict],
+        max_distance: float = 50,
     ) -> list[str]:
         """
         Find nearby label words for context.
 
         Args:
             target_bbox: Target field bounding box
-            all_words: List of all detected words with bbox
+            all_words: All detected words on the page, as PageWords or a list
+                of word dicts with bbox
             max_distance: Maximum distance in pixels to consider as "nearby"
 
         Returns:
             List of nearby word texts
         """
-        nearby = []
+        if not isinstance(all_words, PageWords):
+            all_words = PageWords.from_dicts(all_words)
+
         target_x = target_bbox["x"]
         target_y = target_bbox["y"]
 
-        for word in all_words:
-            word_bbox = word.get("bbox", {})
-            word_x = word_bbox.get("x", 0)
-            word_y = word_bbox.get("y", 0)
-
-            # Calculate distance (simple Manhattan distance)
-            distance = abs(target_x - word_x) + abs(target_y - word_y)
-
-            if distance < max_distance:
-                nearby.append(word.get("text", ""))
-
-        return nearby
+        # Simple Manhattan distance between top-left corners
+        return [
+            text
+            for text, word_x, word_y in zip(all_words.texts, all_words.x, all_words.y)
+            if abs(target_x - word_x) + abs(target_y - word_y) < max_distance
+        ]
@@ -0,0 +1,162 @@
+"""Compact array-backed storage for the words detected on a single page."""
+
+import re
+import sys
+from array import array
+from typing import Any, Iterable
+
+# Alef variants (أ إ آ ٱ) fold to bare alef; tatweel is dropped
+_ARABIC_FOLD = str.maketrans(
+    {
+        "أ": "ا",
+        "إ": "ا",
+        "آ": "ا",
+        "ٱ": "ا",
+        "ـ": None,
+    }
+)
+
+# Harakat, Quranic annotation marks and superscript alef
+_ARABIC_DIACRITICS = re.compile(r"[\u0610-\u061a\u064b-\u065f\u0670\u06d6-\u06ed]")
+
+
+def normalize_arabic(text: str) -> str:
+    """
+    Normalize text for indicator matching.
+
+    Lower-cases, strips surrounding whitespace, folds alef variants,
+    removes tatweel and strips Arabic diacritics.
+
+    Args:
+        text: Raw text
+
+    Returns:
+        Normalized text
+    """
+    return _ARABIC_DIACRITICS.sub("", text.lower().strip().translate(_ARABIC_FOLD))
+
+
+class PageWords:
+    """
+    Words detected on a page, stored as parallel arrays.
+
+    Coordinates and confidences are kept in ``array('d')`` columns instead of
+    one dict per word, and each text is interned alongside its Arabic-normalized
+    (lower-cased) form so classifiers never recompute it.
+    """
+
+    __slots__ = (
+        "texts",
+        "normalized",
+        "x",
+        "y",
+        "width",
+        "height",
+        "confidence",
+    )
+
+    def __init__(self):
+        """Initialize an empty page."""
+        self.texts: list[str] = []
+        self.normalized: list[str] = []
+        self.x = array("d")
+        self.y = array("d")
+        self.width = array("d")
+        self.height = array("d")
+        self.confidence = array("d")
+
+    def append(
+        self,
+        text: str,
+        x: float,
+        y: float,
+        width: float,
+        height: float,
+        confidence: float = 0.0,
+    ) -> None:
+        """
+        Add a word to the page.
+
+        Args:
+            text: Detected text content
+            x: Left edge in pixels
+            y: Top edge in pixels
+            width: Width in pixels
+            height: Height in pixels
+            confidence: OCR confidence score
+        """
+        text = sys.intern(text)
+        self.texts.append(text)
+        self.normalized.append(sys.intern(normalize_arabic(text)))
+        self.x.append(x)
+        self.y.append(y)
+        self.width.append(width)
+        self.height.append(height)
+        self.confidence.append(confidence)
+
+    @classmethod
+    def from_dicts(cls, words: Iterable[dict[str, Any]]) -> "PageWords":
+        """
+        Build a page from the legacy word dict format.
+
+        Args:
+            words: Dicts of {text, bbox: {x, y, width, height}, confidence}
+
+        Returns:
+            PageWords instance
+        """
+        page = cls()
+        for word in words:
+            bbox = word.get("bbox", {})
+            page.append(
+                word.get("text", ""),
+                bbox.get("x", 0),
+                bbox.get("y", 0),
+                bbox.get("width", 0),
+                bbox.get("height", 0),
+                word.get("confidence") or 0.0,
+            )
+        return page
+
+    def __len__(self) -> int:
+        return len(self.texts)
+
+    def bbox(self, index: int) -> dict[str, float]:
+        """Get the pixel bounding box of a word as {x, y, width, height}."""
+        return {
+            "x": self.x[index],
+            "y": self.y[index],
+            "width": self.width[index],
+            "height": self.height[index],
+        }
+
+    def nearby(self, index: int, max_distance: float) -> list[int]:
+        """
+        Find words whose top-left corner lies near the given word.
+
+        Args:
+            index: Index of the target word
+            max_distance: Maximum Manhattan distance in pixels
+
+        Returns:
+            Indices of nearby words, including the target itself
+        """
+        target_x = self.x[index]
+        target_y = self.y[index]
+        return [
+            i
+            for i, (word_x, word_y) in enumerate(zip(self.x, self.y))
+            if abs(target_x - word_x) + abs(target_y - word_y) < max_distance
+        ]
+
+    def to_dicts(self) -> list[dict[str, Any]]:
+        """
+        Convert to the dict format used at the API boundary.
+
+        Returns:
+            List of {text, bbox: {x, y, width, height}, confidence}
+        """
+        return [
+            {"text": text, "bbox": self.bbox(i), "confidence": self.confidence[i]}
+            for i, text in enumerate(self.texts)
+        ]
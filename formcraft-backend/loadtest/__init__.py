@@ -0,0 +1,6 @@
+"""Load-test harness for the form import and detection endpoints.
+
+Runs the forms router against a fake OCR backend and an in-memory Supabase
+stand-in, so it needs neither Azure nor a database. See ``python -m
+loadtest.run --help``.
+"""
@@ -0,0 +1,185 @@
+"""FastAPI app wired to the local OCR and Supabase stand-ins.
+
+Run under uvicorn for multi-worker tests:
+
+    uvicorn loadtest.app:create_app --factory --workers 4
+"""
+
+import asyncio
+import logging
+import os
+import resource
+import time
+import uuid
+from collections import deque
+from contextlib import asynccontextmanager
+from types import SimpleNamespace
+from typing import Any, Callable
+
+from fastapi import FastAPI, Query
+
+from app.api.deps import get_current_user
+from app.api.routes import forms
+from app.services import ocr
+
+from .fakes import (
+    STORE_ADDRESS_ENV,
+    DetectionStore,
+    FakeOCRClient,
+    FakeOCRConfig,
+    InMemorySupabase,
+    connect_store,
+)
+
+logger = logging.getLogger(__name__)
+
+STATS_PATH = "/__loadtest/stats"
+
+# Seconds between stats reports from each worker to the shared store
+STATS_REPORT_INTERVAL = 0.5
+
+
+class EventLoopLagMonitor:
+    """Samples how late the event loop wakes up from a fixed sleep."""
+
+    def __init__(self, interval: float = 0.01, window: int = 10000):
+        """
+        Initialize monitor.
+
+        Args:
+            interval: Sleep interval between samples in seconds
+            window: Number of most recent samples kept
+        """
+        self.interval = interval
+        self.samples: deque[float] = deque(maxlen=window)
+        self.max_lag = 0.0
+
+    async def run(self) -> None:
+        """Sample until cancelled."""
+        loop = asyncio.get_running_loop()
+        while True:
+            start = loop.time()
+            await asyncio.sleep(self.interval)
+            lag = loop.time() - start - self.interval
+            self.samples.append(lag)
+            self.max_lag = max(self.max_lag, lag)
+
+    def reset(self) -> None:
+        self.samples.clear()
+        self.max_lag = 0.0
+
+    def snapshot(self) -> dict[str, float]:
+        """Get lag statistics in milliseconds."""
+        ordered = sorted(self.samples)
+        if not ordered:
+            return {"p50_ms": 0.0, "p99_ms": 0.0, "max_ms": 0.0}
+        return {
+            "p50_ms": round(ordered[len(ordered) // 2] * 1000, 2),
+            "p99_ms": round(ordered[min(len(ordered) - 1, int(len(ordered) * 0.99))] * 1000, 2),
+            "max_ms": round(self.max_lag * 1000, 2),
+        }
+
+
+def peak_rss_mb() -> float:
+    """Peak resident set size of this process in MB (Linux reports KB)."""
+    return round(resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024, 1)
+
+
+async def report_stats(
+    store: DetectionStore,
+    snapshot: Callable[[], dict[str, Any]],
+    reset: Callable[[], None],
+) -> None:
+    """
+    Push this worker's stats to the shared store until cancelled.
+
+    Polling a multi-worker server over HTTP can keep reaching the same worker,
+    so each worker reports on its own and the driver reads them all from the
+    store. Counters are reset whenever the driver calls ``reset_stats``.
+    """
+    pid = os.getpid()
+    generation = 0
+    while True:
+        try:
+            current = await asyncio.to_thread(store.report_stats, pid, generation, snapshot())
+        except Exception as e:
+            logger.warning(f"Stats report failed: {e}")
+        else:
+            if current != generation:
+                reset()
+                generation = current
+                continue
+        await asyncio.sleep(STATS_REPORT_INTERVAL)
+
+
+def install_fakes(config: FakeOCRConfig | None = None) -> InMemorySupabase:
+    """
+    Point the forms routes at the local stand-ins.
+
+    Args:
+        config: Fake OCR behaviour (defaults to FAKE_OCR_* environment variables)
+
+    Returns:
+        The fake Supabase client now used by the routes. It is backed by the
+        shared store server when FAKE_SUPABASE_* is set (multi-worker runs),
+        otherwise by a store local to this process.
+    """
+    FakeOCRClient.configure(config or FakeOCRConfig.from_env())
+    ocr.AzureOCRClient = FakeOCRClient
+
+    client = InMemorySupabase(connect_store())
+    forms.get_supabase_client = lambda: client
+    return client
+
+
+def create_app(config: FakeOCRConfig | None = None) -> FastAPI:
+    """
+    Build the load-test app.
+
+    Args:
+        config: Fake OCR behaviour (defaults to FAKE_OCR_* environment variables)
+
+    Returns:
+        FastAPI app serving the forms router under /api plus a stats endpoint.
+        Workers attached to a shared store also report their stats to it.
+    """
+    client = install_fakes(config)
+    monitor = EventLoopLagMonitor()
+    loadtest_user = SimpleNamespace(id=uuid.uuid4(), role="admin")
+
+    def snapshot() -> dict[str, Any]:
+        return {
+            "pid": os.getpid(),
+            "time": time.time(),
+            "event_loop_lag": monitor.snapshot(),
+            "peak_rss_mb": peak_rss_mb(),
+            "store_calls": client.timings(),
+        }
+
+    def reset() -> None:
+        monitor.reset()
+        client.reset_timings()
+
+    @asynccontextmanager
+    async def lifespan(app: FastAPI):
+        tasks = [asyncio.create_task(monitor.run())]
+        if os.environ.get(STORE_ADDRESS_ENV):
+            tasks.append(asyncio.create_task(report_stats(client.store, snapshot, reset)))
+        try:
+            yield
+        finally:
+            for task in tasks:
+                task.cancel()
+
+    app = FastAPI(lifespan=lifespan)
+    app.include_router(forms.router, prefix="/api")
+    app.dependency_overrides[get_current_user] = lambda: loadtest_user
+
+    @app.get(STATS_PATH)
+    async def stats(reset_counters: bool = Query(False, alias="reset")):
+        current = snapshot()
+        if reset_counters:
+            reset()
+        return current
+
+    return app
@@ -0,0 +1,480 @@
+"""Local stand-ins for Azure Document Intelligence and Supabase."""
+
+import hashlib
+import json
+import logging
+import os
+import random
+import secrets
+import threading
+import time
+import uuid
+from collections import deque
+from dataclasses import dataclass
+from multiprocessing.managers import BaseManager
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+from typing import Any
+
+from app.services.ocr import PageWords
+
+logger = logging.getLogger(__name__)
+
+# Texts mixed into synthetic pages so every classifier branch gets exercised
+SYNTHETIC_TEXTS = [
+    "التاريخ",
+    "25-09-2012",
+    "المبلغ",
+    "12,345.67",
+    "EGP",
+    "ادفعوا لأمر",
+    "Pay to",
+    "التوقيع",
+    "Signature",
+    "0012345678",
+    "بنك مصر",
+    "X",
+]
+
+
+@dataclass
+class FakeOCRConfig:
+    """Behaviour of the fake OCR backend."""
+
+    latency_ms: float = 2000.0
+    jitter_ms: float = 500.0
+    error_rate: float = 0.0
+    recordings_dir: str | None = None
+    synthetic_words: int = 150
+
+    @classmethod
+    def from_env(cls) -> "FakeOCRConfig":
+        """Read config from FAKE_OCR_* environment variables (shared by uvicorn workers)."""
+        return cls(
+            latency_ms=float(os.environ.get("FAKE_OCR_LATENCY_MS", cls.latency_ms)),
+            jitter_ms=float(os.environ.get("FAKE_OCR_JITTER_MS", cls.jitter_ms)),
+            error_rate=float(os.environ.get("FAKE_OCR_ERROR_RATE", cls.error_rate)),
+            recordings_dir=os.environ.get("FAKE_OCR_RECORDINGS") or None,
+            synthetic_words=int(
+                os.environ.get("FAKE_OCR_SYNTHETIC_WORDS", cls.synthetic_words)
+            ),
+        )
+
+    def to_env(self) -> dict[str, str]:
+        """Export config as FAKE_OCR_* environment variables."""
+        env = {
+            "FAKE_OCR_LATENCY_MS": str(self.latency_ms),
+            "FAKE_OCR_JITTER_MS": str(self.jitter_ms),
+            "FAKE_OCR_ERROR_RATE": str(self.error_rate),
+            "FAKE_OCR_SYNTHETIC_WORDS": str(self.synthetic_words),
+        }
+        if self.recordings_dir:
+            env["FAKE_OCR_RECORDINGS"] = self.recordings_dir
+        return env
+
+
+def load_recordings(recordings_dir: str | None) -> dict[str, dict[str, Any]]:
+    """
+    Load recorded analyze_layout outputs.
+
+    Args:
+        recordings_dir: Directory of JSON files written by ``loadtest.record``
+
+    Returns:
+        Recordings keyed by the sha256 of the source image
+    """
+    recordings: dict[str, dict[str, Any]] = {}
+    if not recordings_dir:
+        return recordings
+
+    for path in sorted(Path(recordings_dir).glob("*.json")):
+        with open(path, encoding="utf-8") as f:
+            recording = json.load(f)
+        recordings[recording["sha256"]] = recording
+
+    logger.info(f"Loaded {len(recordings)} OCR recordings from {recordings_dir}")
+    return recordings
+
+
+def synthetic_layout(word_count: int, seed: int = 0) -> dict[str, Any]:
+    """
+    Generate a cheque-sized layout with words on a grid.
+
+    Args:
+        word_count: Number of words to generate
+        seed: Random seed so every call returns the same page
+
+    Returns:
+        Layout in the recorded (dict) format
+    """
+    rng = random.Random(seed)
+    page_width, page_height = 1700.0, 750.0
+    columns = 10
+    words = []
+    for i in range(word_count):
+        words.append(
+            {
+                "text": SYNTHETIC_TEXTS[i % len(SYNTHETIC_TEXTS)],
+                "bbox": {
+                    "x": 40.0 + (i % columns) * 160.0 + rng.uniform(0, 20),
+                    "y": 30.0 + ((i // columns) * 45.0) % (page_height - 60),
+                    "width": rng.uniform(40, 150),
+                    "height": rng.uniform(18, 30),
+                },
+                "confidence": round(rng.uniform(0.6, 1.0), 3),
+            }
+        )
+    return {
+        "words": words,
+        "lines": [],
+        "page_dimensions": {"width": page_width, "height": page_height},
+    }
+
+
+class FakeOCRClient:
+    """
+    Drop-in replacement for AzureOCRClient.
+
+    Blocks for the configured latency like the real SDK poller does, fails at
+    the configured rate, and replays a recording when the uploaded image
+    matches one (falling back to a synthetic page).
+    """
+
+    config = FakeOCRConfig()
+    recordings: dict[str, dict[str, Any]] = {}
+    _synthetic = synthetic_layout(FakeOCRConfig.synthetic_words)
+
+    @classmethod
+    def configure(cls, config: FakeOCRConfig) -> None:
+        """Set the behaviour shared by all instances."""
+        cls.config = config
+        cls.recordings = load_recordings(config.recordings_dir)
+        cls._synthetic = synthetic_layout(config.synthetic_words)
+
+    def analyze_layout(self, image_bytes: bytes) -> dict[str, Any]:
+        """Return a recorded or synthetic layout after simulated latency."""
+        config = self.config
+        delay_ms = max(0.0, config.latency_ms + random.uniform(-1, 1) * config.jitter_ms)
+        time.sleep(delay_ms / 1000)
+
+        if random.random() < config.error_rate:
+            raise RuntimeError("Fake OCR service error")
+
+        layout = self.recordings.get(hashlib.sha256(image_bytes).hexdigest())
+        if layout is None:
+            layout = self._synthetic
+
+        return {
+            "words": PageWords.from_dicts(layout["words"]),
+            "lines": layout["lines"],
+            "page_dimensions": layout["page_dimensions"],
+        }
+
+
+class DetectionStore:
+    """
+    Thread-safe in-memory tables behind the fake Supabase client.
+
+    One instance can be shared by several uvicorn workers through
+    ``serve_store``; every method takes and returns plain picklable data.
+    """
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.tables: dict[str, dict[str, dict[str, Any]]] = {}
+        self._clock = 0
+        self._stats_generation = 0
+        self._worker_stats: dict[int, dict[str, Any]] = {}
+
+    def _now(self) -> datetime:
+        # Strictly increasing so ordering by created_at is deterministic
+        self._clock += 1
+        return datetime.now(timezone.utc) + timedelta(microseconds=self._clock)
+
+    @staticmethod
+    def _matches(row: dict[str, Any], filters: list[tuple[str, Any]]) -> bool:
+        return all(row.get(column) == value for column, value in filters)
+
+    def clear(self) -> None:
+        """Drop all rows."""
+        with self.lock:
+            self.tables.clear()
+
+    def report_stats(self, pid: int, generation: int, stats: dict[str, Any]) -> int:
+        """
+        Record a worker's latest load-test stats.
+
+        Reports made before the last ``reset_stats`` are dropped.
+
+        Returns:
+            The current stats generation; a worker that sees a newer one
+            should reset its counters and report again
+        """
+        with self.lock:
+            if generation == self._stats_generation:
+                self._worker_stats[pid] = stats
+            return self._stats_generation
+
+    def reset_stats(self) -> None:
+        """Discard reported stats and ask every worker to reset its counters."""
+        with self.lock:
+            self._stats_generation += 1
+            self._worker_stats.clear()
+
+    def worker_stats(self) -> list[dict[str, Any]]:
+        """Latest stats reported by each worker since the last reset."""
+        with self.lock:
+            return list(self._worker_stats.values())
+
+    def insert(self, table: str, data: dict[str, Any]) -> list[dict[str, Any]]:
+        with self.lock:
+            row = {"id": str(uuid.uuid4()), "created_at": self._now().isoformat(), **data}
+            self.tables.setdefault(table, {})[row["id"]] = row
+            return [row]
+
+    def select(
+        self,
+        table: str,
+        filters: list[tuple[str, Any]],
+        order_by: tuple[str, bool] | None = None,
+    ) -> list[dict[str, Any]]:
+        with self.lock:
+            rows = self.tables.get(table, {})
+            matched = [row for row in rows.values() if self._matches(row, filters)]
+        if order_by:
+            column, desc = order_by
+            matched.sort(key=lambda row: row[column], reverse=desc)
+        return matched
+
+    def delete(self, table: str, filters: list[tuple[str, Any]]) -> list[dict[str, Any]]:
+        with self.lock:
+            rows = self.tables.get(table, {})
+            matched = [row for row in rows.values() if self._matches(row, filters)]
+            for row in matched:
+                del rows[row["id"]]
+            return matched
+
+    def purge_form_detections(
+        self,
+        p_max_age: str | None = None,
+        p_keep_last: int | None = None,
+        p_template_id: str | None = None,
+        p_batch_size: int = 500,
+    ) -> dict[str, int]:
+        """Mirror of the SQL function in migrations/009_form_detections_retention.sql."""
+        with self.lock:
+            rows = self.tables.setdefault("form_detections", {})
+            candidates = [
+                row
+                for row in rows.values()
+                if p_template_id is None or row["template_id"] == p_template_id
+            ]
+
+            doomed: dict[str, dict[str, Any]] = {}
+            if p_max_age is not None:
+                days = int(p_max_age.split()[0])
+                cutoff = (datetime.now(timezone.utc) - timedelta(days=days)).isoformat()
+                for row in sorted(candidates, key=lambda r: r["created_at"]):
+                    if row["created_at"] < cutoff:
+                        doomed[row["id"]] = row
+            if p_keep_last is not None:
+                by_template: dict[str, list[dict[str, Any]]] = {}
+                for row in candidates:
+                    by_template.setdefault(row["template_id"], []).append(row)
+                for template_rows in by_template.values():
+                    template_rows.sort(key=lambda r: r["created_at"], reverse=True)
+                    for row in template_rows[p_keep_last:]:
+                        doomed[row["id"]] = row
+
+            batch = list(doomed.values())[:p_batch_size]
+            reclaimed = 0
+            for row in batch:
+                reclaimed += len(json.dumps(row, default=str))
+                del rows[row["id"]]
+
+            return {"deleted_rows": len(batch), "reclaimed_bytes": reclaimed}
+
+
+class _Response:
+    """Mimics the postgrest APIResponse."""
+
+    def __init__(self, data: list[dict[str, Any]]):
+        self.data = data
+
+
+class _Query:
+    """Chainable query over one table, executed against the store."""
+
+    def __init__(self, client: "InMemorySupabase", table: str):
+        self.client = client
+        self.table = table
+        self.action = "select"
+        self.payload: dict[str, Any] | None = None
+        self.filters: list[tuple[str, Any]] = []
+        self.order_by: tuple[str, bool] | None = None
+
+    def select(self, *columns: str) -> "_Query":
+        self.action = "select"
+        return self
+
+    def insert(self, data: dict[str, Any]) -> "_Query":
+        self.action = "insert"
+        self.payload = data
+        return self
+
+    def delete(self) -> "_Query":
+        self.action = "delete"
+        return self
+
+    def eq(self, column: str, value: Any) -> "_Query":
+        self.filters.append((column, value))
+        return self
+
+    def order(self, column: str, desc: bool = False) -> "_Query":
+        self.order_by = (column, desc)
+        return self
+
+    def execute(self) -> _Response:
+        if self.action == "insert":
+            return _Response(self.client.call("insert", self.table, self.payload))
+        if self.action == "delete":
+            return _Response(self.client.call("delete", self.table, self.filters))
+        return _Response(
+            self.client.call("select", self.table, self.filters, self.order_by)
+        )
+
+
+class _RPC:
+    """Deferred call to a store-backed database function."""
+
+    def __init__(self, client: "InMemorySupabase", name: str, params: dict[str, Any]):
+        self.client = client
+        self.name = name
+        self.params = params
+
+    def execute(self) -> _Response:
+        if self.name != "purge_form_detections":
+            raise ValueError(f"Unknown RPC: {self.name}")
+        return _Response([self.client.call("purge_form_detections", **self.params)])
+
+
+class InMemorySupabase:
+    """
+    Stand-in for the Supabase client.
+
+    Supports the subset of the table and RPC API used by the forms routes.
+    Every store call is timed, so the cost of the shared store server (one
+    lock, one IPC round trip per call) can be told apart from the app's own.
+    """
+
+    def __init__(self, store: DetectionStore | None = None, window: int = 10000):
+        """
+        Initialize client.
+
+        Args:
+            store: Local store or a proxy from ``connect_store`` (default: new local store)
+            window: Number of most recent call timings kept
+        """
+        self.store = store if store is not None else DetectionStore()
+        self._timing_lock = threading.Lock()
+        self._call_count = 0
+        self._call_total = 0.0
+        self._call_seconds: deque[float] = deque(maxlen=window)
+
+    def table(self, name: str) -> _Query:
+        return _Query(self, name)
+
+    def rpc(self, name: str, params: dict[str, Any]) -> _RPC:
+        return _RPC(self, name, params)
+
+    def call(self, method: str, *args: Any, **kwargs: Any) -> Any:
+        """Call a store method and record how long it took."""
+        start = time.perf_counter()
+        try:
+            return getattr(self.store, method)(*args, **kwargs)
+        finally:
+            elapsed = time.perf_counter() - start
+            with self._timing_lock:
+                self._call_count += 1
+                self._call_total += elapsed
+                self._call_seconds.append(elapsed)
+
+    def reset_timings(self) -> None:
+        with self._timing_lock:
+            self._call_count = 0
+            self._call_total = 0.0
+            self._call_seconds.clear()
+
+    def timings(self) -> dict[str, float]:
+        """Store call count and latency statistics in milliseconds."""
+        with self._timing_lock:
+            count, total = self._call_count, self._call_total
+            ordered = sorted(self._call_seconds)
+        if not ordered:
+            return {"count": 0, "p50_ms": 0.0, "p99_ms": 0.0, "total_ms": 0.0}
+        return {
+            "count": count,
+            "p50_ms": round(ordered[len(ordered) // 2] * 1000, 3),
+            "p99_ms": round(ordered[min(len(ordered) - 1, int(len(ordered) * 0.99))] * 1000, 3),
+            "total_ms": round(total * 1000, 1),
+        }
+
+
+# Environment variables pointing uvicorn workers at the shared store
+STORE_ADDRESS_ENV = "FAKE_SUPABASE_ADDRESS"
+STORE_AUTHKEY_ENV = "FAKE_SUPABASE_AUTHKEY"
+
+_shared_store: DetectionStore | None = None
+
+
+def _get_shared_store() -> DetectionStore:
+    # Runs in the manager's server process
+    global _shared_store
+    if _shared_store is None:
+        _shared_store = DetectionStore()
+    return _shared_store
+
+
+class StoreManager(BaseManager):
+    """Serves one DetectionStore to every worker process."""
+
+
+StoreManager.register("get_store", callable=_get_shared_store)
+
+
+def serve_store() -> tuple[StoreManager, dict[str, str]]:
+    """
+    Start a store server process on a free local port.
+
+    Returns:
+        The running manager (call ``shutdown()`` when done) and the
+        environment variables that make ``connect_store`` reach it
+    """
+    authkey = secrets.token_bytes(16)
+    manager = StoreManager(address=("127.0.0.1", 0), authkey=authkey)
+    manager.start()
+    host, port = manager.address
+    return manager, {
+        STORE_ADDRESS_ENV: f"{host}:{port}",
+        STORE_AUTHKEY_ENV: authkey.hex(),
+    }
+
+
+def connect_store() -> DetectionStore | None:
+    """
+    Connect to the shared store named by the FAKE_SUPABASE_* environment.
+
+    Returns:
+        Proxy to the shared store, or None when no store server is configured
+    """
+    address = os.environ.get(STORE_ADDRESS_ENV)
+    if not address:
+        return None
+
+    host, port = address.rsplit(":", 1)
+    manager = StoreManager(
+        address=(host, int(port)), authkey=bytes.fromhex(os.environ[STORE_AUTHKEY_ENV])
+    )
+    manager.connect()
+    logger.info(f"Using shared fake Supabase store at {address}")
+    return manager.get_store()
@@ -0,0 +1,49 @@
+"""Record real Azure OCR outputs for the sample images.
+
+Requires Azure credentials (see AZURE_SETUP.md). The recordings are replayed
+by the fake OCR backend when the same image is uploaded:
+
+    python -m loadtest.record --out loadtest/recordings
+"""
+
+import argparse
+import hashlib
+import json
+import logging
+from pathlib import Path
+
+from app.services import ocr
+
+from .run import SAMPLES_DIR, load_samples
+
+logger = logging.getLogger(__name__)
+
+
+def main(argv: list[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(prog="python -m loadtest.record")
+    parser.add_argument("--samples", default=str(SAMPLES_DIR), help="Directory of images to analyze")
+    parser.add_argument("--out", required=True, help="Directory to write recordings to")
+    args = parser.parse_args(argv)
+    logging.basicConfig(level=logging.INFO)
+
+    out_dir = Path(args.out)
+    out_dir.mkdir(parents=True, exist_ok=True)
+    client = ocr.AzureOCRClient()
+
+    for name, content in load_samples(Path(args.samples)):
+        result = client.analyze_layout(content)
+        recording = {
+            "source": name,
+            "sha256": hashlib.sha256(content).hexdigest(),
+            "words": result["words"].to_dicts(),
+            "lines": result["lines"],
+            "page_dimensions": result["page_dimensions"],
+        }
+        path = out_dir / f"{Path(name).stem}.json"
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(recording, f, ensure_ascii=False)
+        logger.info(f"Recorded {len(recording['words'])} words from {name} to {path}")
+
+
+if __name__ == "__main__":
+    main()
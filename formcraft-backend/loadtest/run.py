@@ -0,0 +1,584 @@
+"""Drive a mixed workload against the forms endpoints and report results.
+
+Examples:
+
+    # In-process, 16 concurrent clients for 30s
+    python -m loadtest.run --concurrency 16 --duration 30
+
+    # Open-loop 20 RPS against 1, 2 and 4 uvicorn workers
+    python -m loadtest.run --rps 20 --workers 1,2,4 --ocr-latency-ms 1500
+
+    # Against an already running server
+    python -m loadtest.run --url http://localhost:8000 --concurrency 32
+"""
+
+import argparse
+import asyncio
+import json
+import logging
+import os
+import random
+import subprocess
+import sys
+import time
+import uuid
+from collections import defaultdict
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any
+
+import httpx
+
+from .app import (
+    STATS_PATH,
+    STATS_REPORT_INTERVAL,
+    EventLoopLagMonitor,
+    create_app,
+    peak_rss_mb,
+)
+from .fakes import DetectionStore, FakeOCRConfig, serve_store
+
+logger = logging.getLogger(__name__)
+
+SAMPLES_DIR = Path(__file__).resolve().parents[2] / "Samples"
+
+OPERATIONS = ("import", "list", "accept", "delete", "purge")
+DEFAULT_MIX = "import=1,list=5,accept=2,delete=1,purge=0.2"
+
+# Operations on a detection another in-flight request may already have removed
+MISS_OPERATIONS = ("accept", "delete")
+
+
+@dataclass
+class OpResult:
+    """Outcome of a single request."""
+
+    op: str
+    status: int
+    latency: float
+
+    @property
+    def is_miss(self) -> bool:
+        """Target detection was already gone (a workload race, not a server fault)."""
+        return self.status == 404 and self.op in MISS_OPERATIONS
+
+    @property
+    def is_error(self) -> bool:
+        return (self.status == 0 or self.status >= 400) and not self.is_miss
+
+
+@dataclass
+class RunReport:
+    """Aggregated results of one load run."""
+
+    label: str
+    duration: float
+    results: list[OpResult] = field(default_factory=list)
+    dropped: int = 0
+    client_lag: dict[str, float] = field(default_factory=dict)
+    client_peak_rss_mb: float = 0.0
+    server_stats: list[dict[str, Any]] = field(default_factory=list)
+
+    def summary(self) -> dict[str, Any]:
+        """Throughput, error counts and latency percentiles per operation."""
+        by_op: dict[str, list[OpResult]] = defaultdict(list)
+        for result in self.results:
+            by_op[result.op].append(result)
+
+        operations = {}
+        for op, results in sorted(by_op.items()):
+            latencies = sorted(r.latency for r in results)
+            operations[op] = {
+                "count": len(results),
+                "errors": sum(1 for r in results if r.is_error),
+                "misses": sum(1 for r in results if r.is_miss),
+                "rps": round(len(results) / self.duration, 2),
+                "p50_ms": percentile_ms(latencies, 50),
+                "p90_ms": percentile_ms(latencies, 90),
+                "p99_ms": percentile_ms(latencies, 99),
+                "max_ms": percentile_ms(latencies, 100),
+            }
+
+        return {
+            "label": self.label,
+            "duration_s": round(self.duration, 2),
+            "requests": len(self.results),
+            "throughput_rps": round(len(self.results) / self.duration, 2),
+            "errors": sum(op["errors"] for op in operations.values()),
+            "misses": sum(op["misses"] for op in operations.values()),
+            "dropped": self.dropped,
+            "operations": operations,
+            "client_event_loop_lag": self.client_lag,
+            "client_peak_rss_mb": self.client_peak_rss_mb,
+            "server_workers": len(self.server_stats),
+            "server_event_loop_lag_max_ms": max(
+                (s["event_loop_lag"]["max_ms"] for s in self.server_stats), default=None
+            ),
+            "server_event_loop_lag_p99_ms": max(
+                (s["event_loop_lag"]["p99_ms"] for s in self.server_stats), default=None
+            ),
+            "server_peak_rss_mb": max(
+                (s["peak_rss_mb"] for s in self.server_stats), default=None
+            ),
+            "server_store_calls": sum(s["store_calls"]["count"] for s in self.server_stats),
+            "server_store_call_p50_ms": max(
+                (s["store_calls"]["p50_ms"] for s in self.server_stats), default=None
+            ),
+            "server_store_call_p99_ms": max(
+                (s["store_calls"]["p99_ms"] for s in self.server_stats), default=None
+            ),
+        }
+
+
+def percentile_ms(ordered: list[float], pct: float) -> float:
+    """Nearest-rank percentile of sorted latencies, in milliseconds."""
+    if not ordered:
+        return 0.0
+    rank = max(0, min(len(ordered) - 1, int(round(pct / 100 * len(ordered))) - 1))
+    return round(ordered[rank] * 1000, 2)
+
+
+def parse_mix(mix: str) -> dict[str, float]:
+    """Parse ``op=weight,...`` into a weight table."""
+    weights = {}
+    for part in mix.split(","):
+        op, _, weight = part.partition("=")
+        op = op.strip()
+        if op not in OPERATIONS:
+            raise argparse.ArgumentTypeError(f"Unknown operation in mix: {op}")
+        weights[op] = float(weight or 1)
+    return weights
+
+
+def load_samples(samples_dir: Path) -> list[tuple[str, bytes]]:
+    """Read sample form images to upload."""
+    samples = [
+        (path.name, path.read_bytes())
+        for path in sorted(samples_dir.glob("*"))
+        if path.suffix.lower() in (".jpg", ".jpeg", ".png")
+    ]
+    if not samples:
+        raise SystemExit(f"No sample images found in {samples_dir}")
+    return samples
+
+
+class Workload:
+    """Issues one randomly chosen operation at a time against the API."""
+
+    def __init__(
+        self,
+        client: httpx.AsyncClient,
+        mix: dict[str, float],
+        samples: list[tuple[str, bytes]],
+        template_count: int,
+        seed: int,
+    ):
+        self.client = client
+        self.ops = list(mix)
+        self.weights = list(mix.values())
+        self.samples = samples
+        self.templates = [str(uuid.uuid4()) for _ in range(template_count)]
+        self.detections: dict[str, list[tuple[str, int]]] = defaultdict(list)
+        self.rng = random.Random(seed)
+
+    async def request(self) -> OpResult:
+        """Run one operation and time it."""
+        op = self.rng.choices(self.ops, self.weights)[0]
+        template_id = self.rng.choice(self.templates)
+        known = self.detections[template_id]
+
+        # Operations on an existing detection fall back to creating one
+        if op in MISS_OPERATIONS and not known:
+            op = "import"
+
+        start = time.perf_counter()
+        try:
+            status = await getattr(self, f"_{op}")(template_id, known)
+        except httpx.HTTPError as e:
+            logger.debug(f"{op} failed: {e}")
+            status = 0
+        return OpResult(op, status, time.perf_counter() - start)
+
+    async def _import(self, template_id: str, known: list[tuple[str, int]]) -> int:
+        name, content = self.rng.choice(self.samples)
+        response = await self.client.post(
+            f"/api/forms/import/{template_id}",
+            files={"file": (name, content, "image/jpeg")},
+            params={"page_index": 0},
+        )
+        if response.status_code == 200:
+            body = response.json()
+            known.append((body["id"], len(body["detected_fields"])))
+        return response.status_code
+
+    async def _list(self, template_id: str, known: list[tuple[str, int]]) -> int:
+        response = await self.client.get(f"/api/forms/{template_id}/detections")
+        return response.status_code
+
+    async def _accept(self, template_id: str, known: list[tuple[str, int]]) -> int:
+        detection_id, field_count = self.rng.choice(known)
+        indices = list(range(min(field_count, 5)))
+        response = await self.client.post(
+            f"/api/forms/{template_id}/detections/{detection_id}/accept",
+            json={"detection_ids": indices},
+        )
+        return response.status_code
+
+    async def _delete(self, template_id: str, known: list[tuple[str, int]]) -> int:
+        detection_id, _ = known.pop(self.rng.randrange(len(known)))
+        response = await self.client.delete(f"/api/forms/detections/{detection_id}")
+        return response.status_code
+
+    async def _purge(self, template_id: str, known: list[tuple[str, int]]) -> int:
+        keep_last = 2
+        response = await self.client.delete(
+            f"/api/forms/{template_id}/detections", params={"keep_last": keep_last}
+        )
+        # Newest detections were appended last
+        del known[:-keep_last]
+        return response.status_code
+
+
+async def closed_loop(workload: Workload, concurrency: int, deadline: float) -> list[OpResult]:
+    """Keep ``concurrency`` requests in flight until the deadline."""
+    results: list[OpResult] = []
+
+    async def user() -> None:
+        while time.perf_counter() < deadline:
+            results.append(await workload.request())
+
+    await asyncio.gather(*(user() for _ in range(concurrency)))
+    return results
+
+
+async def open_loop(
+    workload: Workload, rps: float, max_in_flight: int, deadline: float
+) -> tuple[list[OpResult], int]:
+    """Start requests at a fixed arrival rate; drop arrivals beyond ``max_in_flight``."""
+    results: list[OpResult] = []
+    in_flight: set[asyncio.Task] = set()
+    dropped = 0
+    interval = 1 / rps
+    next_arrival = time.perf_counter()
+
+    async def issue() -> None:
+        results.append(await workload.request())
+
+    while next_arrival < deadline:
+        await asyncio.sleep(max(0.0, next_arrival - time.perf_counter()))
+        next_arrival += interval
+        if len(in_flight) >= max_in_flight:
+            dropped += 1
+            continue
+        task = asyncio.create_task(issue())
+        in_flight.add(task)
+        task.add_done_callback(in_flight.discard)
+
+    if in_flight:
+        await asyncio.gather(*in_flight)
+    return results, dropped
+
+
+async def collect_server_stats(
+    client: httpx.AsyncClient,
+    workers: int,
+    reset: bool = False,
+    store: DetectionStore | None = None,
+) -> list[dict[str, Any]]:
+    """
+    Gather stats from every server worker.
+
+    Spawned workers report to the shared store, which is read directly. For
+    other servers the stats endpoint is polled (best effort), closing the
+    connection after each request so polls are not pinned to one worker by
+    keep-alive.
+    """
+    if store is not None:
+        return await read_reported_stats(store, workers, reset)
+
+    by_pid: dict[int, dict[str, Any]] = {}
+    for _ in range(workers * 8):
+        response = await client.get(
+            STATS_PATH, params={"reset": reset}, headers={"Connection": "close"}
+        )
+        stats = response.json()
+        by_pid[stats["pid"]] = stats
+        if len(by_pid) >= workers:
+            break
+    return list(by_pid.values())
+
+
+async def read_reported_stats(
+    store: DetectionStore, workers: int, reset: bool = False
+) -> list[dict[str, Any]]:
+    """
+    Wait until every worker has reported to the shared store, then return the reports.
+
+    Args:
+        store: Shared store proxy
+        workers: Number of workers expected to report
+        reset: Reset worker counters first; returns once every worker has
+            acknowledged the reset
+    """
+    if reset:
+        await asyncio.to_thread(store.reset_stats)
+    since = time.time()
+    deadline = time.monotonic() + 20 * STATS_REPORT_INTERVAL
+
+    while True:
+        stats = [
+            s for s in await asyncio.to_thread(store.worker_stats) if s["time"] >= since
+        ]
+        if len(stats) >= workers:
+            return stats
+        if time.monotonic() >= deadline:
+            logger.warning(f"Only {len(stats)} of {workers} workers reported stats")
+            return stats
+        await asyncio.sleep(STATS_REPORT_INTERVAL / 2)
+
+
+async def run_load(
+    client: httpx.AsyncClient,
+    args: argparse.Namespace,
+    label: str,
+    workers: int,
+    store: DetectionStore | None = None,
+) -> RunReport:
+    """Warm up, then drive the configured workload and collect stats."""
+    samples = load_samples(Path(args.samples))
+    workload = Workload(client, parse_mix(args.mix), samples, args.templates, args.seed)
+    monitor = EventLoopLagMonitor()
+    monitor_task = asyncio.create_task(monitor.run())
+
+    try:
+        if args.warmup > 0:
+            await closed_loop(
+                workload, max(1, args.concurrency // 4), time.perf_counter() + args.warmup
+            )
+        await collect_server_stats(client, workers, reset=True, store=store)
+        monitor.reset()
+
+        start = time.perf_counter()
+        deadline = start + args.duration
+        if args.rps:
+            results, dropped = await open_loop(
+                workload, args.rps, args.max_in_flight, deadline
+            )
+        else:
+            results, dropped = await closed_loop(workload, args.concurrency, deadline), 0
+        duration = time.perf_counter() - start
+
+        server_stats = await collect_server_stats(client, workers, store=store)
+    finally:
+        monitor_task.cancel()
+
+    return RunReport(
+        label=label,
+        duration=duration,
+        results=results,
+        dropped=dropped,
+        client_lag=monitor.snapshot(),
+        client_peak_rss_mb=peak_rss_mb(),
+        server_stats=server_stats,
+    )
+
+
+def fake_ocr_config(args: argparse.Namespace) -> FakeOCRConfig:
+    return FakeOCRConfig(
+        latency_ms=args.ocr_latency_ms,
+        jitter_ms=args.ocr_jitter_ms,
+        error_rate=args.ocr_error_rate,
+        recordings_dir=args.recordings,
+        synthetic_words=args.synthetic_words,
+    )
+
+
+async def run_in_process(args: argparse.Namespace) -> RunReport:
+    """Run app and driver in one process, sharing one event loop."""
+    app = create_app(fake_ocr_config(args))
+    transport = httpx.ASGITransport(app=app)
+    async with app.router.lifespan_context(app):
+        async with httpx.AsyncClient(
+            transport=transport, base_url="http://loadtest", timeout=args.timeout
+        ) as client:
+            return await run_load(client, args, "in-process", workers=1)
+
+
+async def run_against_url(
+    args: argparse.Namespace,
+    url: str,
+    label: str,
+    workers: int,
+    store: DetectionStore | None = None,
+) -> RunReport:
+    limits = httpx.Limits(max_connections=max(args.concurrency, args.max_in_flight))
+    async with httpx.AsyncClient(base_url=url, timeout=args.timeout, limits=limits) as client:
+        return await run_load(client, args, label, workers, store)
+
+
+def spawn_server(
+    args: argparse.Namespace, workers: int, store_env: dict[str, str]
+) -> subprocess.Popen:
+    """Start uvicorn with the load-test app and wait until it answers."""
+    env = {**os.environ, **fake_ocr_config(args).to_env(), **store_env}
+    process = subprocess.Popen(
+        [
+            sys.executable,
+            "-m",
+            "uvicorn",
+            "loadtest.app:create_app",
+            "--factory",
+            "--port",
+            str(args.port),
+            "--workers",
+            str(workers),
+            "--log-level",
+            "warning",
+        ],
+        cwd=Path(__file__).resolve().parents[1],
+        env=env,
+    )
+
+    url = f"http://127.0.0.1:{args.port}{STATS_PATH}"
+    deadline = time.monotonic() + 30
+    while time.monotonic() < deadline:
+        if process.poll() is not None:
+            raise SystemExit(f"uvicorn exited with code {process.returncode}")
+        try:
+            httpx.get(url, timeout=1).raise_for_status()
+            return process
+        except httpx.HTTPError:
+            time.sleep(0.2)
+
+    process.terminate()
+    raise SystemExit("uvicorn did not become ready within 30s")
+
+
+def print_report(summary: dict[str, Any]) -> None:
+    print(f"\n== {summary['label']} ==")
+    print(
+        f"{summary['requests']} requests in {summary['duration_s']}s: "
+        f"{summary['throughput_rps']} req/s, {summary['errors']} errors, "
+        f"{summary['misses']} misses, {summary['dropped']} dropped"
+    )
+    print(
+        f"{'op':<8}{'count':>8}{'err':>6}{'miss':>6}{'rps':>9}"
+        f"{'p50':>10}{'p90':>10}{'p99':>10}{'max':>10}"
+    )
+    for op, stats in summary["operations"].items():
+        print(
+            f"{op:<8}{stats['count']:>8}{stats['errors']:>6}{stats['misses']:>6}{stats['rps']:>9}"
+            f"{stats['p50_ms']:>10}{stats['p90_ms']:>10}{stats['p99_ms']:>10}{stats['max_ms']:>10}"
+        )
+    print(
+        f"server: {summary['server_workers']} workers, loop lag p99/max "
+        f"{summary['server_event_loop_lag_p99_ms']}/{summary['server_event_loop_lag_max_ms']} ms, "
+        f"peak RSS {summary['server_peak_rss_mb']} MB"
+    )
+    print(
+        f"store:  {summary['server_store_calls']} calls, latency p50/p99 "
+        f"{summary['server_store_call_p50_ms']}/{summary['server_store_call_p99_ms']} ms"
+    )
+    print(
+        f"client: loop lag max {summary['client_event_loop_lag'].get('max_ms')} ms, "
+        f"peak RSS {summary['client_peak_rss_mb']} MB"
+    )
+
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(
+        prog="python -m loadtest.run",
+        description="Load-test the form import and detection endpoints.",
+    )
+    target = parser.add_mutually_exclusive_group()
+    target.add_argument("--url", help="Base URL of a running server (default: in-process)")
+    target.add_argument(
+        "--workers",
+        help="Comma-separated uvicorn worker counts to spawn and compare, e.g. 1,2,4",
+    )
+    parser.add_argument("--port", type=int, default=8765, help="Port for spawned servers")
+
+    load = parser.add_argument_group("load")
+    load.add_argument("--concurrency", type=int, default=8, help="Closed-loop concurrent clients")
+    load.add_argument("--rps", type=float, help="Open-loop target request rate (overrides --concurrency)")
+    load.add_argument("--max-in-flight", type=int, default=256, help="Open-loop in-flight cap")
+    load.add_argument("--duration", type=float, default=30, help="Measured seconds")
+    load.add_argument("--warmup", type=float, default=5, help="Unmeasured warm-up seconds")
+    load.add_argument("--mix", default=DEFAULT_MIX, help=f"Operation weights (default {DEFAULT_MIX})")
+    load.add_argument("--templates", type=int, default=20, help="Number of template ids to spread load over")
+    load.add_argument("--samples", default=str(SAMPLES_DIR), help="Directory of images to upload")
+    load.add_argument("--timeout", type=float, default=60, help="Per-request timeout in seconds")
+    load.add_argument("--seed", type=int, default=0)
+
+    fake = parser.add_argument_group("fake OCR")
+    fake.add_argument("--ocr-latency-ms", type=float, default=FakeOCRConfig.latency_ms)
+    fake.add_argument("--ocr-jitter-ms", type=float, default=FakeOCRConfig.jitter_ms)
+    fake.add_argument("--ocr-error-rate", type=float, default=FakeOCRConfig.error_rate)
+    fake.add_argument("--recordings", help="Directory of recordings from loadtest.record")
+    fake.add_argument("--synthetic-words", type=int, default=FakeOCRConfig.synthetic_words)
+
+    parser.add_argument("--json", help="Write summaries to this JSON file")
+    return parser
+
+
+def main(argv: list[str] | None = None) -> None:
+    args = build_parser().parse_args(argv)
+    logging.basicConfig(level=logging.WARNING)
+
+    reports: list[RunReport] = []
+    if args.url:
+        reports.append(asyncio.run(run_against_url(args, args.url, args.url, workers=1)))
+    elif args.workers:
+        # One store server shared by all workers, so a detection created on one
+        # worker is visible to the others
+        manager, store_env = serve_store()
+        store = manager.get_store()
+        try:
+            for workers in (int(w) for w in args.workers.split(",")):
+                store.clear()
+                process = spawn_server(args, workers, store_env)
+                try:
+                    reports.append(
+                        asyncio.run(
+                            run_against_url(
+                                args,
+                                f"http://127.0.0.1:{args.port}",
+                                f"{workers} workers",
+                                workers,
+                                store,
+                            )
+                        )
+                    )
+                finally:
+                    process.terminate()
+                    process.wait()
+        finally:
+            manager.shutdown()
+    else:
+        reports.append(asyncio.run(run_in_process(args)))
+
+    summaries = [report.summary() for report in reports]
+    for summary in summaries:
+        print_report(summary)
+
+    if len(summaries) > 1:
+        print("\n== scaling ==")
+        print(f"{'':<12}{'req/s':>10}{'store p99 ms':>14}")
+        for summary in summaries:
+            print(
+                f"{summary['label']:<12}{summary['throughput_rps']:>10}"
+                f"{str(summary['server_store_call_p99_ms']):>14}"
+            )
+        print(
+            "Note: all workers share one fake store process that serializes every\n"
+            "call behind a single lock. If store p99 grows with the worker count,\n"
+            "the fake store, not the app, is what stops throughput scaling."
+        )
+
+    if args.json:
+        with open(args.json, "w", encoding="utf-8") as f:
+            json.dump(summaries, f, indent=2)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,182 @@
+"""Shared fixtures: minimal in-memory Supabase and OCR stand-ins."""
+
+import uuid
+from datetime import datetime, timedelta, timezone
+from typing import Any
+
+import pytest
+
+
+class FakeOCRClient:
+    """Stand-in for AzureOCRClient returning the same synthetic cheque page."""
+
+    TEXTS = ["التاريخ", "25-09-2012", "المبلغ", "12,345.67", "Pay to", "التوقيع", "X"]
+    WORD_COUNT = 40
+
+    def analyze_layout(self, image_bytes: bytes) -> dict[str, Any]:
+        # Imported here: the OCR package needs backend-only modules
+        from app.services.ocr import PageWords
+
+        words = PageWords()
+        for i in range(self.WORD_COUNT):
+            words.append(
+                self.TEXTS[i % len(self.TEXTS)],
+                x=40.0 + (i % 10) * 160.0,
+                y=30.0 + (i // 10) * 45.0,
+                width=120.0,
+                height=24.0,
+                confidence=round(0.6 + (i % 5) * 0.1, 1),
+            )
+        return {
+            "words": words,
+            "lines": [],
+            "page_dimensions": {"width": 1700.0, "height": 750.0},
+        }
+
+
+class FakeResponse:
+    def __init__(self, data: list[dict[str, Any]]):
+        self.data = data
+
+
+class FakeQuery:
+    """The subset of the postgrest query builder used by the routes."""
+
+    def __init__(self, client: "FakeSupabase", table: str):
+        self.client = client
+        self.rows = client.tables.setdefault(table, [])
+        self.action = "select"
+        self.payload: dict[str, Any] | None = None
+        self.filters: list[tuple[str, Any]] = []
+        self.order_by: tuple[str, bool] | None = None
+
+    def select(self, *columns: str) -> "FakeQuery":
+        self.action = "select"
+        return self
+
+    def insert(self, data: dict[str, Any]) -> "FakeQuery":
+        self.action = "insert"
+        self.payload = data
+        return self
+
+    def delete(self) -> "FakeQuery":
+        self.action = "delete"
+        return self
+
+    def eq(self, column: str, value: Any) -> "FakeQuery":
+        self.filters.append((column, value))
+        return self
+
+    def order(self, column: str, desc: bool = False) -> "FakeQuery":
+        self.order_by = (column, desc)
+        return self
+
+    def execute(self) -> FakeResponse:
+        if self.action == "insert":
+            row = {"id": str(uuid.uuid4()), "created_at": self.client.now(), **self.payload}
+            self.rows.append(row)
+            return FakeResponse([row])
+
+        matched = [
+            row for row in self.rows if all(row.get(c) == v for c, v in self.filters)
+        ]
+        if self.action == "delete":
+            for row in matched:
+                self.rows.remove(row)
+        elif self.order_by:
+            column, desc = self.order_by
+            matched.sort(key=lambda row: row[column], reverse=desc)
+        return FakeResponse(matched)
+
+
+class FakeRPC:
+    def __init__(self, client: "FakeSupabase", name: str, params: dict[str, Any]):
+        self.client = client
+        self.name = name
+        self.params = params
+
+    def execute(self) -> FakeResponse:
+        if self.name != "purge_form_detections":
+            raise ValueError(f"Unknown RPC: {self.name}")
+        self.client.rpc_calls += 1
+        return FakeResponse([self.client.purge_form_detections(**self.params)])
+
+
+class FakeSupabase:
+    """In-memory Supabase client mirroring the form_detections SQL function."""
+
+    def __init__(self):
+        self.tables: dict[str, list[dict[str, Any]]] = {}
+        self.rpc_calls = 0
+        self._clock = datetime.now(timezone.utc)
+
+    def now(self) -> str:
+        # Strictly increasing so ordering by created_at is deterministic
+        self._clock += timedelta(microseconds=1)
+        return self._clock.isoformat()
+
+    def table(self, name: str) -> FakeQuery:
+        return FakeQuery(self, name)
+
+    def rpc(self, name: str, params: dict[str, Any]) -> FakeRPC:
+        return FakeRPC(self, name, params)
+
+    def purge_form_detections(
+        self,
+        p_max_age: str | None = None,
+        p_keep_last: int | None = None,
+        p_template_id: str | None = None,
+        p_batch_size: int = 500,
+    ) -> dict[str, int]:
+        """Same selection as migrations/009_form_detections_retention.sql."""
+        rows = self.tables.setdefault("form_detections", [])
+        candidates = sorted(
+            (r for r in rows if p_template_id is None or r["template_id"] == p_template_id),
+            key=lambda r: r["created_at"],
+        )
+
+        doomed: dict[str, dict[str, Any]] = {}
+        if p_max_age is not None:
+            cutoff = datetime.now(timezone.utc) - timedelta(days=int(p_max_age.split()[0]))
+            for row in candidates:
+                if datetime.fromisoformat(row["created_at"]) < cutoff:
+                    doomed[row["id"]] = row
+        if p_keep_last is not None:
+            by_template: dict[str, list[dict[str, Any]]] = {}
+            for row in candidates:
+                by_template.setdefault(row["template_id"], []).append(row)
+            for template_rows in by_template.values():
+                for row in template_rows[: max(0, len(template_rows) - p_keep_last)]:
+                    doomed[row["id"]] = row
+
+        batch = list(doomed.values())[:p_batch_size]
+        for row in batch:
+            rows.remove(row)
+        return {"deleted_rows": len(batch), "reclaimed_bytes": 100 * len(batch)}
+
+    def insert_detections(self, template_id: str, count: int) -> None:
+        """Seed ``count`` detections for a template, oldest first."""
+        for _ in range(count):
+            self.table("form_detections").insert(
+                {
+                    "template_id": template_id,
+                    "page_index": 0,
+                    "detected_fields": [],
+                    "page_dimensions": {"width": 210.0, "height": 99.0},
+                }
+            ).execute()
+
+
+@pytest.fixture
+def supabase() -> FakeSupabase:
+    return FakeSupabase()
+
+
+@pytest.fixture
+def fake_ocr(monkeypatch) -> type[FakeOCRClient]:
+    """Route OCR through FakeOCRClient."""
+    from app.services import ocr
+
+    # setattr would read the old value first and import the Azure SDK
+    monkeypatch.setitem(vars(ocr), "AzureOCRClient", FakeOCRClient)
+    return FakeOCRClient
@@ -0,0 +1,123 @@
+"""Fast-path detection responses must match the FormDetectionResponse schema."""
+
+import uuid
+from datetime import datetime
+from pathlib import Path
+from types import SimpleNamespace
+
+import pytest
+
+# The forms router needs FastAPI and modules that live in the backend repo
+pytest.importorskip("fastapi")
+pytest.importorskip("app.api.deps")
+pytest.importorskip("app.core.supabase")
+
+from fastapi import FastAPI  # noqa: E402
+from fastapi.testclient import TestClient  # noqa: E402
+from pydantic import ValidationError  # noqa: E402
+
+from app.api.deps import get_current_user  # noqa: E402
+from app.api.routes import forms  # noqa: E402
+from app.models.form_detection import (  # noqa: E402
+    DetectedField,
+    DetectedFieldDict,
+    DetectedFieldList,
+    FormDetectionResponse,
+)
+
+SAMPLE_IMAGE = Path(__file__).resolve().parents[2] / "Samples" / "BanqueMisr_EG.jpg"
+
+
+@pytest.fixture
+def client(monkeypatch, supabase, fake_ocr):
+    monkeypatch.setattr(forms, "get_supabase_client", lambda: supabase)
+
+    app = FastAPI()
+    app.include_router(forms.router, prefix="/api")
+    app.dependency_overrides[get_current_user] = lambda: SimpleNamespace(id=uuid.uuid4())
+    return TestClient(app)
+
+
+def import_sample(client: TestClient, template_id: str):
+    return client.post(
+        f"/api/forms/import/{template_id}",
+        files={"file": (SAMPLE_IMAGE.name, SAMPLE_IMAGE.read_bytes(), "image/jpeg")},
+    )
+
+
+def assert_matches_schema(payload: dict) -> None:
+    """The fast-path payload equals its Pydantic round trip, except created_at formatting."""
+    expected = FormDetectionResponse.model_validate(payload).model_dump(mode="json")
+
+    # created_at is passed through as stored ("+00:00"); Pydantic would emit "Z"
+    assert datetime.fromisoformat(payload["created_at"]) == datetime.fromisoformat(
+        expected["created_at"].replace("Z", "+00:00")
+    )
+    assert {**payload, "created_at": None} == {**expected, "created_at": None}
+
+
+def test_import_response_matches_schema(client):
+    response = import_sample(client, str(uuid.uuid4()))
+
+    assert response.status_code == 200
+    assert response.json()["detected_fields"]
+    assert_matches_schema(response.json())
+
+
+def test_get_detections_matches_schema(client):
+    template_id = str(uuid.uuid4())
+    created = import_sample(client, template_id).json()
+
+    response = client.get(f"/api/forms/{template_id}/detections")
+
+    assert response.status_code == 200
+    assert response.json() == [created]
+    for payload in response.json():
+        assert_matches_schema(payload)
+
+
+def test_large_response_is_gzipped_when_accepted(client):
+    template_id = str(uuid.uuid4())
+    import_sample(client, template_id)
+
+    response = client.get(
+        f"/api/forms/{template_id}/detections",
+        headers={"Accept-Encoding": "gzip"},
+    )
+
+    assert response.headers["content-encoding"] == "gzip"
+    # The test client decodes gzip transparently
+    assert_matches_schema(response.json()[0])
+
+
+FIELD = {
+    "text": "x",
+    "bbox": {"x": 0.0, "y": 0.0, "width": 1.0, "height": 1.0},
+    "confidence": 0.5,
+    "suggested_type": "text",
+    "status": "pending",
+}
+
+
+def test_write_time_validation_yields_plain_dicts():
+    validated = DetectedFieldList.validate_python([FIELD])
+
+    assert validated == [FIELD]
+    assert type(validated[0]) is dict
+
+
+@pytest.mark.parametrize(
+    "override",
+    [{"confidence": 1.5}, {"confidence": -0.1}, {"suggested_type": "image"}, {"status": "done"}],
+)
+def test_write_time_validation_rejects_what_the_model_rejects(override):
+    field = {**FIELD, **override}
+
+    with pytest.raises(ValidationError):
+        DetectedField.model_validate(field)
+    with pytest.raises(ValidationError):
+        DetectedFieldList.validate_python([field])
+
+
+def test_detected_field_dict_mirrors_model():
+    assert DetectedFieldDict.__annotations__.keys() == DetectedField.model_fields.keys()
@@ -0,0 +1,131 @@
+"""Tests for the form_detections retention job and bulk delete endpoint."""
+
+import uuid
+from datetime import datetime, timedelta, timezone
+from types import SimpleNamespace
+
+import pytest
+
+# app.core lives in the backend repo
+pytest.importorskip("app.core.config")
+pytest.importorskip("app.core.supabase")
+
+from app.services import detection_retention  # noqa: E402
+from app.services.detection_retention import (  # noqa: E402
+    DetectionRetentionJob,
+    retention_metrics,
+)
+
+
+def detections(supabase, template_id: str) -> list[dict]:
+    return supabase.table("form_detections").select("*").eq("template_id", template_id).execute().data
+
+
+def test_purge_loops_until_short_batch(supabase):
+    template_id = str(uuid.uuid4())
+    supabase.insert_detections(template_id, 5)
+
+    stats = DetectionRetentionJob(supabase, keep_last=0, batch_size=2).purge()
+
+    assert stats == {"deleted_rows": 5, "reclaimed_bytes": 500, "batches": 3, "complete": True}
+    assert detections(supabase, template_id) == []
+
+
+def test_purge_reports_incomplete_when_batch_cap_hit(supabase):
+    template_id = str(uuid.uuid4())
+    supabase.insert_detections(template_id, 5)
+
+    stats = DetectionRetentionJob(supabase, keep_last=0, batch_size=2, max_batches=2).purge()
+
+    assert stats["deleted_rows"] == 4
+    assert stats["batches"] == 2
+    assert stats["complete"] is False
+    assert len(detections(supabase, template_id)) == 1
+
+
+def test_keep_last_keeps_newest_per_template(supabase):
+    kept, other = str(uuid.uuid4()), str(uuid.uuid4())
+    supabase.insert_detections(kept, 4)
+    supabase.insert_detections(other, 1)
+    newest = sorted(detections(supabase, kept), key=lambda r: r["created_at"])[-2:]
+
+    DetectionRetentionJob(supabase, keep_last=2).purge(template_id=uuid.UUID(kept))
+
+    assert sorted(detections(supabase, kept), key=lambda r: r["created_at"]) == newest
+    assert len(detections(supabase, other)) == 1
+
+
+def test_max_age_deletes_only_old_rows(supabase):
+    template_id = str(uuid.uuid4())
+    supabase.insert_detections(template_id, 3)
+    old = detections(supabase, template_id)[0]
+    old["created_at"] = (datetime.now(timezone.utc) - timedelta(days=30)).isoformat()
+
+    stats = DetectionRetentionJob(supabase, max_age_days=7).purge()
+
+    assert stats["deleted_rows"] == 1
+    assert old not in detections(supabase, template_id)
+
+
+def test_disabled_job_makes_no_calls(supabase):
+    supabase.insert_detections(str(uuid.uuid4()), 3)
+
+    stats = DetectionRetentionJob(supabase).purge()
+
+    assert stats["deleted_rows"] == 0
+    assert supabase.rpc_calls == 0
+
+
+def test_from_settings_defaults_to_disabled(supabase, monkeypatch):
+    monkeypatch.setattr(detection_retention, "settings", SimpleNamespace())
+
+    job = DetectionRetentionJob.from_settings(supabase)
+
+    assert not job.enabled
+    assert job.batch_size == detection_retention.DEFAULT_BATCH_SIZE
+
+
+def test_purge_records_metrics(supabase):
+    supabase.insert_detections(str(uuid.uuid4()), 3)
+    before = retention_metrics.snapshot()
+
+    DetectionRetentionJob(supabase, keep_last=0).purge()
+
+    after = retention_metrics.snapshot()
+    assert after["runs"] == before["runs"] + 1
+    assert after["deleted_rows"] == before["deleted_rows"] + 3
+    assert after["reclaimed_bytes"] == before["reclaimed_bytes"] + 300
+    assert after["last_run"]["deleted_rows"] == 3
+
+
+def test_bulk_delete_endpoint(supabase, monkeypatch):
+    pytest.importorskip("fastapi")
+    pytest.importorskip("app.api.deps")
+    from fastapi import FastAPI
+    from fastapi.testclient import TestClient
+
+    from app.api.deps import get_current_user
+    from app.api.routes import forms
+
+    monkeypatch.setattr(forms, "get_supabase_client", lambda: supabase)
+    app = FastAPI()
+    app.include_router(forms.router, prefix="/api")
+    app.dependency_overrides[get_current_user] = lambda: SimpleNamespace(id=uuid.uuid4())
+    client = TestClient(app)
+
+    template_id, other = str(uuid.uuid4()), str(uuid.uuid4())
+    supabase.insert_detections(template_id, 4)
+    supabase.insert_detections(other, 2)
+
+    response = client.delete(f"/api/forms/{template_id}/detections", params={"keep_last": 1})
+
+    assert response.status_code == 200
+    body = response.json()
+    assert body["deleted_rows"] == 3
+    assert body["reclaimed_bytes"] == 300
+    assert body["complete"] is True
+    assert len(detections(supabase, template_id)) == 1
+    assert len(detections(supabase, other)) == 2
+
+    metrics = client.get("/api/forms/detections/retention").json()
+    assert metrics["last_run"]["deleted_rows"] == 3
@@ -0,0 +1,90 @@
+"""Import-time regression tests for the lazily loaded OCR backends."""
+
+import re
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+BACKEND_DIR = Path(__file__).resolve().parents[1]
+
+# Heavy modules that must not be imported until OCR is actually used
+HEAVY_MODULES = ("azure", "PIL")
+
+# Generous cumulative budget for importing the OCR package itself
+OCR_PACKAGE_IMPORT_BUDGET_US = 500_000
+
+# Modules each import target needs that live in the backend repo, not here
+REQUIRED_MODULES = {
+    "app.services.ocr": ("app.models.enums",),
+    "app.api.routes.forms": (
+        "fastapi",
+        "pydantic",
+        "app.models.enums",
+        "app.models.user",
+        "app.core.config",
+        "app.core.supabase",
+        "app.api.deps",
+    ),
+}
+
+
+def require_importable(module: str) -> None:
+    """Skip unless every module ``module`` depends on can be imported."""
+    for name in REQUIRED_MODULES[module]:
+        pytest.importorskip(name)
+
+
+def run_python(code: str, *flags: str) -> subprocess.CompletedProcess:
+    """Run code in a fresh interpreter from the backend directory."""
+    return subprocess.run(
+        [sys.executable, *flags, "-c", code],
+        cwd=BACKEND_DIR,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+
+
+@pytest.mark.parametrize("module", ["app.services.ocr", "app.api.routes.forms"])
+def test_import_does_not_load_heavy_backends(module):
+    require_importable(module)
+    result = run_python(
+        f"import sys, {module}; "
+        f"print(','.join(m for m in {HEAVY_MODULES!r} if m in sys.modules))"
+    )
+    assert result.stdout.strip() == ""
+
+
+def test_ocr_package_import_time_within_budget():
+    require_importable("app.services.ocr")
+    result = run_python("import app.services.ocr", "-X", "importtime")
+
+    # stderr lines: "import time: self [us] | cumulative | imported package"
+    match = re.search(r"\|\s*(\d+)\s*\|\s*app\.services\.ocr\s*$", result.stderr, re.M)
+    assert match, result.stderr
+    assert int(match.group(1)) < OCR_PACKAGE_IMPORT_BUDGET_US
+
+
+def test_azure_client_loads_on_first_access():
+    require_importable("app.services.ocr")
+    pytest.importorskip("azure.ai.formrecognizer")
+    result = run_python(
+        "import sys; from app.services import ocr; "
+        "before = 'azure' in sys.modules; ocr.AzureOCRClient; "
+        "print(before, 'azure' in sys.modules)"
+    )
+    assert result.stdout.split() == ["False", "True"]
+
+
+def test_warm_up_preloads_backends():
+    require_importable("app.services.ocr")
+    pytest.importorskip("azure.ai.formrecognizer")
+    pytest.importorskip("PIL")
+    result = run_python(
+        "import sys; from app.services import ocr; "
+        "before = ocr.is_warm(); ocr.warm_up(); "
+        f"print(before, ocr.is_warm(), all(m in sys.modules for m in {HEAVY_MODULES!r}))"
+    )
+    assert result.stdout.split() == ["False", "True", "True"]
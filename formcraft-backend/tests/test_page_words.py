@@ -0,0 +1,129 @@
+"""Tests for the array-backed page word model and its use by the classifier."""
+
+import random
+
+import pytest
+
+# field_classifier imports app.models.enums, which lives in the backend repo
+pytest.importorskip("app.models.enums")
+
+from app.services.ocr import (  # noqa: E402
+    BoundingBoxConverter,
+    FieldClassifier,
+    PageWords,
+    normalize_arabic,
+)
+
+TEXTS = [
+    "التاريخ",
+    "25-09-2012",
+    "المبلغ",
+    "12,345.67",
+    "EGP",
+    "ادفعوا لأمر",
+    "Pay to",
+    "التوقيع",
+    "Signature",
+    "0012345678",
+    "X",
+    "",
+]
+
+
+def synthetic_words(count: int, seed: int = 0) -> list[dict]:
+    rng = random.Random(seed)
+    return [
+        {
+            "text": TEXTS[i % len(TEXTS)],
+            "bbox": {
+                "x": rng.uniform(0, 1600),
+                "y": rng.uniform(0, 700),
+                "width": rng.uniform(5, 150),
+                "height": rng.uniform(5, 30),
+            },
+            "confidence": round(rng.uniform(0, 1), 3),
+        }
+        for i in range(count)
+    ]
+
+
+def legacy_nearby_labels(target_bbox: dict, all_words: list[dict], max_distance: float) -> list[str]:
+    """The dict-walking implementation PageWords replaced."""
+    nearby = []
+    for word in all_words:
+        word_bbox = word.get("bbox", {})
+        distance = abs(target_bbox["x"] - word_bbox.get("x", 0)) + abs(
+            target_bbox["y"] - word_bbox.get("y", 0)
+        )
+        if distance < max_distance:
+            nearby.append(word.get("text", ""))
+    return nearby
+
+
+@pytest.mark.parametrize(
+    ("text", "expected"),
+    [
+        ("أسم", "اسم"),
+        ("إسم", "اسم"),
+        ("آمنة", "امنة"),
+        ("ٱلتاريخ", "التاريخ"),
+        ("التاريـــخ", "التاريخ"),
+        ("التَّارِيخُ", "التاريخ"),
+        ("مَبْلَغٌ", "مبلغ"),
+        ("  Pay To ", "pay to"),
+    ],
+)
+def test_normalize_arabic(text, expected):
+    assert normalize_arabic(text) == expected
+
+
+def test_from_dicts_to_dicts_round_trip():
+    words = synthetic_words(50)
+
+    page = PageWords.from_dicts(words)
+
+    assert len(page) == 50
+    assert page.to_dicts() == words
+    assert page.normalized[0] == normalize_arabic(words[0]["text"])
+
+
+def test_classify_word_matches_legacy_classification():
+    words = synthetic_words(300)
+    page = PageWords.from_dicts(words)
+    converter = BoundingBoxConverter(1700, 750, dpi=150)
+    classifier = FieldClassifier()
+
+    bboxes_mm = converter.convert_page_words(page)
+
+    for index, word in enumerate(words):
+        legacy = classifier.classify_field(
+            text=word["text"],
+            bbox=converter.convert_bbox(word["bbox"]),
+            nearby_labels=legacy_nearby_labels(word["bbox"], words, 100),
+        )
+        assert bboxes_mm[index] == converter.convert_bbox(word["bbox"])
+        assert classifier.classify_word(page, index, bboxes_mm[index], 100) == legacy
+
+
+def test_get_nearby_labels_accepts_legacy_dicts():
+    words = synthetic_words(100)
+    classifier = FieldClassifier()
+
+    for word in words[:10]:
+        expected = legacy_nearby_labels(word["bbox"], words, 100)
+        assert classifier.get_nearby_labels(word["bbox"], words, 100) == expected
+        assert (
+            classifier.get_nearby_labels(word["bbox"], PageWords.from_dicts(words), 100)
+            == expected
+        )
+
+
+def test_diacritics_in_labels_still_match_indicators():
+    page = PageWords.from_dicts(
+        [
+            {"text": "التَّارِيـخ", "bbox": {"x": 0, "y": 0, "width": 40, "height": 10}},
+            {"text": "15", "bbox": {"x": 50, "y": 0, "width": 20, "height": 10}},
+        ]
+    )
+
+    assert FieldClassifier().classify_word(page, 1, {"width": 5, "height": 3}, 100) == "date"
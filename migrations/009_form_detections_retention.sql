@@ -0,0 +1,69 @@
+-- Migration: 009_form_detections_retention
+-- Bounded batch purge of stale form_detections rows
+
+-- Index for per-template "keep last N" ranking and newest-first listing
+CREATE INDEX IF NOT EXISTS idx_form_detections_template_created_at
+    ON public.form_detections(template_id, created_at DESC);
+
+-- Delete at most p_batch_size detections that are older than p_max_age
+-- or beyond the p_keep_last most recent for their template.
+-- Optionally restricted to a single template. Returns rows and bytes reclaimed.
+-- Runs as the caller so RLS policies still apply to user-initiated purges.
+CREATE OR REPLACE FUNCTION public.purge_form_detections(
+    p_max_age INTERVAL DEFAULT NULL,
+    p_keep_last INT DEFAULT NULL,
+    p_template_id UUID DEFAULT NULL,
+    p_batch_size INT DEFAULT 500
+)
+RETURNS TABLE (deleted_rows BIGINT, reclaimed_bytes BIGINT)
+LANGUAGE sql
+SECURITY INVOKER
+AS $$
+    WITH expired AS (
+        -- Walks idx_form_detections_created_at oldest-first
+        SELECT fd.id
+        FROM public.form_detections fd
+        WHERE p_max_age IS NOT NULL
+          AND fd.created_at < NOW() - p_max_age
+          AND (p_template_id IS NULL OR fd.template_id = p_template_id)
+        ORDER BY fd.created_at
+        LIMIT p_batch_size
+    ),
+    surplus AS (
+        SELECT ranked.id
+        FROM (
+            SELECT
+                fd.id,
+                fd.created_at,
+                row_number() OVER (
+                    PARTITION BY fd.template_id ORDER BY fd.created_at DESC
+                ) AS rn
+            FROM public.form_detections fd
+            WHERE p_keep_last IS NOT NULL
+              AND (p_template_id IS NULL OR fd.template_id = p_template_id)
+        ) ranked
+        WHERE ranked.rn > p_keep_last
+        ORDER BY ranked.created_at
+        LIMIT p_batch_size
+    ),
+    batch AS (
+        SELECT id FROM expired
+        UNION
+        SELECT id FROM surplus
+        LIMIT p_batch_size
+    ),
+    deleted AS (
+        DELETE FROM public.form_detections fd
+        USING batch
+        WHERE fd.id = batch.id
+        RETURNING pg_column_size(fd.*)::BIGINT AS size
+    )
+    SELECT count(*)::BIGINT, COALESCE(SUM(deleted.size), 0)::BIGINT
+    FROM deleted;
+$$;
+
+GRANT EXECUTE ON FUNCTION public.purge_form_detections(INTERVAL, INT, UUID, INT)
+    TO authenticated, service_role;
+
+COMMENT ON FUNCTION public.purge_form_detections(INTERVAL, INT, UUID, INT) IS
+    'Deletes one bounded batch of stale form detections; call repeatedly until deleted_rows < p_batch_size.';